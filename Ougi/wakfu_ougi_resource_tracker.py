@@ -5,28 +5,133 @@ Full-screen transparent overlay with draggable icons anywhere on screen
 Tracks rage and tracker resources in real-time from chat logs
 """
 
+import os
 import sys
 import threading
-import time
 import re
 import math
 import json
+import queue
+import logging
+import logging.handlers
+from collections import OrderedDict, deque
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QProgressBar, QFrame, QMenu)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QPoint, QRect
-from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QLinearGradient, QBrush, QPixmap, QPen, QAction
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QPoint, QRect, QFileSystemWatcher, QRunnable, QThreadPool
+from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QLinearGradient, QBrush, QPixmap, QPen, QAction, QPixmapCache
 from PyQt6.QtWidgets import QGraphicsOpacityEffect
 
+_logger = logging.getLogger(__name__)
+# Per-spell debug output; off by default since spell lines arrive many times per second in combat
+DEBUG_SPELLS = False
+# Overlay state and drag tracing, hit from the animation tick; the messages are only built when this is on
+DEBUG_TRACKER = False
+
+# Combat log lines are split once on this prefix; the anchored matchers below run on the message after it
+_COMBAT_PREFIX = "[Information (combat)] "
+# Spell cast matchers, compiled once at import instead of on every log line
+# Caster and spell in one pass; supports both "Name: lance le sort" and "Name lance le sort"
+_SPELL_CAST_RE = re.compile(r'\s*([^:\n]+?)\s*:?\s+lance le sort ([^\(\n]+)')
+_SPELL_NAME_RE = re.compile(r'lance le sort ([^\(\n]+)')
+# Resource, buff and damage matchers used by parse_log_line
+_RAGE_RE = re.compile(r'rage \(\+(\d+) Niv\.\)')
+_RAGE_PLAYER_RE = re.compile(r'([^:]+): rage')
+_TRACKER_RE = re.compile(r'tracker \(\+(\d+) Niv\.\)')
+_TRACKER_LOSS_PLAYER_RE = re.compile(r'([^:]+): n\'est plus sous l\'emprise de \'tracker\'')
+_TRACKER_GAIN_RE = re.compile(r'tracker \(\+(\d+) Niv\.\) \((Compulsion|rage)\)')
+_TRACKER_DAMAGE_RE = re.compile(r'.*: -(\d+) PV \([^)]+\) \(tracker\)')
+_PREPARATION_RE = re.compile(r'Préparation \(\+(\d+) Niv\.\)')
+_DAMAGE_RE = re.compile(r'([^:]+):\s*-(\d+)\s*PV')
+# Raw log lines the tracker can react to; everything else is dropped by the reader thread
+_RELEVANT_LINE_RE = re.compile(b'|'.join(re.escape(marker.encode('utf-8')) for marker in (
+    "[Information (combat)]",  # Spell casts, rage/tracker gains and losses, turn ends
+    "Combat terminé",
+    "Sac à patate",
+    "est hors-combat",
+    "est KO !",
+)))
+# Lit tracker bar, shared by every bar
+_TRACKER_BAR_STYLE = """
+    QFrame {
+        background-color: rgba(100, 200, 255, 200);
+        border: 1px solid rgba(150, 220, 255, 255);
+        border-radius: 3px;
+    }
+"""
+# Splits a cost label into its number and resource type, e.g. "12PA" -> "12", "PA"
+_NUM_RES_RE = re.compile(r'(\d*)(.*)', re.DOTALL)
+
+def _dbg(make_message):
+    """Log a tracker debug message, calling make_message to build it only when DEBUG_TRACKER is on"""
+    if DEBUG_TRACKER:
+        _logger.debug(make_message())
+
+def _step_bounce(offset, velocity, gravity, damping, min_velocity, ground_level):
+    """Advance one frame of bounce physics; returns (offset, velocity, settled)"""
+    # Apply gravity to velocity, then update position based on velocity
+    velocity += gravity
+    offset += velocity
+    
+    # Check for ground collision (bounce)
+    if offset >= ground_level:
+        # Hit the ground - reverse velocity and apply damping
+        offset = ground_level
+        velocity = -velocity * damping
+        
+        # Stop bouncing if velocity is too small
+        if abs(velocity) < min_velocity:
+            return ground_level, 0, True
+    return offset, velocity, False
+
+def _load_icon(icon_path):
+    """Decode an icon image once, through Qt's shared QPixmapCache"""
+    pixmap = QPixmapCache.find(icon_path)
+    if pixmap is None:
+        pixmap = QPixmap(icon_path)
+        QPixmapCache.insert(icon_path, pixmap)
+    return pixmap
+
+def _load_scaled_pixmap(icon_path, width, height):
+    """Get an icon scaled to width x height, through Qt's shared QPixmapCache"""
+    key = f"{icon_path}@{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = _load_icon(icon_path).scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+def _config_point(entry):
+    """(x, y) of a {'x': int, 'y': int} config entry, or None when it is missing or malformed"""
+    if not isinstance(entry, dict):
+        return None
+    x, y = entry.get('x'), entry.get('y')
+    if not (isinstance(x, int) and isinstance(y, int)):
+        return None
+    return x, y
+
+def _write_positions(config_file, positions):
+    """Write the positions config file"""
+    try:
+        with open(config_file, 'w', encoding='utf-8') as f:
+            json.dump(positions, f, indent=2)
+    except OSError:
+        pass  # Silently skip a save the file system refuses
+
 class LogMonitorThread(QThread):
-    """Thread for monitoring log file"""
-    log_updated = pyqtSignal(str)
+    """Thread for monitoring log file, feeding raw lines to a LogParserThread"""
     
-    def __init__(self, log_file_path):
+    def __init__(self, log_file_path, line_queue):
         super().__init__()
         self.log_file = Path(log_file_path)
+        self.line_queue = line_queue  # Bounded: blocks the reader if the parser falls behind
         self.monitoring = True
         self.last_position = 0
+        self._fh = None  # Persistent binary handle, kept open between reads
+        self.pending_bytes = bytearray()  # Bytes read past the last complete line
+        self.watcher = None
+        self.consecutive_errors = 0
+        self.max_errors = 5
         
         # Initialize position to end of file to ignore existing content
         self.initialize_position_to_end()
@@ -35,74 +140,197 @@ class LogMonitorThread(QThread):
         """Set the file position to the end to ignore existing content"""
         try:
             if self.log_file.exists():
-                with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    f.seek(0, 2)  # Seek to end of file
-                    self.last_position = f.tell()
-                print(f"DEBUG: Log monitor initialized at position {self.last_position} (end of file)")
+                self._fh = open(self.log_file, 'rb', buffering=0)
+                self.last_position = self._fh.seek(0, 2)  # Seek to end of file
+                _logger.debug("Log monitor initialized at position %d (end of file)", self.last_position)
             else:
-                print("DEBUG: Log file doesn't exist yet, will start from beginning when created")
+                _logger.debug("Log file doesn't exist yet, will start from beginning when created")
         except Exception as e:
-            print(f"DEBUG: Error initializing log position: {e}")
+            _logger.warning("Error initializing log position: %s", e)
             self.last_position = 0
         
     def run(self):
         """Monitor log file for changes"""
-        consecutive_errors = 0
-        max_errors = 5
-        
-        while self.monitoring:
+        # The watcher lives in this thread; direct connections keep its
+        # notifications (and the reads they trigger) off the GUI thread
+        watcher = QFileSystemWatcher()
+        watcher.fileChanged.connect(self.on_path_changed, Qt.ConnectionType.DirectConnection)
+        watcher.directoryChanged.connect(self.on_path_changed, Qt.ConnectionType.DirectConnection)
+        self.watcher = watcher
+        watching = self.watch_paths()
+        
+        # Slow safety poll: change notifications can lag on files held open by the game,
+        # and it is the only wake-up source if the watcher could not be started
+        fallback_timer = QTimer()
+        fallback_timer.timeout.connect(self.read_new_lines, Qt.ConnectionType.DirectConnection)
+        fallback_timer.start(1000)
+        if not watching:
+            _logger.debug("File watcher unavailable, falling back to 1s polling")
+        
+        # Catch up with anything written before the event loop started
+        self.read_new_lines()
+        self.exec()
+        
+        fallback_timer.stop()
+        self.watcher = None
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+    
+    def watch_paths(self):
+        """(Re)register the log file and its folder with the watcher"""
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        for path in (str(self.log_file.parent), str(self.log_file)):
+            if path not in watched and Path(path).exists():
+                self.watcher.addPath(path)
+        return bool(self.watcher.files() or self.watcher.directories())
+    
+    def on_path_changed(self, path):
+        """Handle a change notification for the log file or its folder"""
+        # A deleted/recreated file drops out of the watcher, so re-add it
+        self.watch_paths()
+        self.read_new_lines()
+    
+    def reopen_if_rotated(self):
+        """Open the log file if needed, starting over when it was replaced or truncated"""
+        if self._fh is not None:
             try:
-                if self.log_file.exists():
-                    with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        f.seek(self.last_position)
-                        new_lines = f.readlines()
-                        self.last_position = f.tell()
-                        
-                        if new_lines:
-                            for line in new_lines:
-                                line = line.strip()
-                                if line:
-                                    # Debug: Log when we emit a line
-                                    if "lance le sort" in line:
-                                        timestamp = time.strftime("%H:%M:%S")
-                                        print(f"DEBUG [{timestamp}]: LogMonitor emitting spell line: {line[:80]}...")
-                                    self.log_updated.emit(line)
-                            
-                            consecutive_errors = 0
-                        else:
-                            time.sleep(0.1)
-                else:
-                    time.sleep(1)
-                    consecutive_errors = 0
-                
-            except Exception as e:
-                consecutive_errors += 1
-                print(f"Error monitoring log file: {e}")
-                
-                if consecutive_errors >= max_errors:
-                    print(f"Too many consecutive errors, stopping monitoring")
+                current = os.stat(self.log_file)
+            except FileNotFoundError:
+                return  # Keep the old handle until a new file appears
+            opened = os.fstat(self._fh.fileno())
+            if current.st_ino == opened.st_ino and current.st_size >= self.last_position:
+                return
+            self._fh.close()
+            self._fh = None
+            _logger.debug("Log file rotated or truncated, reading from start")
+        
+        if self.log_file.exists():
+            self._fh = open(self.log_file, 'rb', buffering=0)
+            self.last_position = 0
+            self.pending_bytes.clear()
+    
+    def read_new_lines(self, *args):
+        """Read and emit every line appended since the last read"""
+        if not self.monitoring:
+            return
+        try:
+            self.reopen_if_rotated()
+            if self._fh is None:
+                return
+            
+            fd = self._fh.fileno()
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
                     break
+                self.last_position += len(chunk)
+                self.pending_bytes += chunk
                 
-                sleep_time = min(1 * (2 ** consecutive_errors), 10)
-                time.sleep(sleep_time)
+                # Only hand over complete lines; a partial last line waits for the rest
+                line_end = self.pending_bytes.rfind(b'\n')
+                if line_end < 0:
+                    continue
+                complete = self.pending_bytes[:line_end]
+                del self.pending_bytes[:line_end + 1]
+                # One queue item per read: the whole batch crosses to the GUI thread as one signal
+                batch = [raw_line for raw_line in complete.split(b'\n') if _RELEVANT_LINE_RE.search(raw_line)]
+                if batch:
+                    self.line_queue.put(batch)
+            
+            self.consecutive_errors = 0
+        
+        except Exception as e:
+            self.consecutive_errors += 1
+            _logger.warning("Error monitoring log file: %s", e)
+            
+            if self.consecutive_errors >= self.max_errors:
+                _logger.warning("Too many consecutive errors, stopping monitoring")
+                self.stop_monitoring()
     
     def stop_monitoring(self):
         """Stop monitoring"""
         self.monitoring = False
+        self.quit()
+
+class LogParserThread(QThread):
+    """Thread decoding raw log lines off the GUI thread before they are parsed"""
+    log_updated = pyqtSignal(list)
+    
+    def __init__(self, line_queue):
+        super().__init__()
+        self.line_queue = line_queue
+    
+    def run(self):
+        """Drain the queue of line batches until the shutdown sentinel (None) arrives"""
+        while True:
+            raw_lines = self.line_queue.get()
+            if raw_lines is None:
+                break
+            
+            lines = []
+            for raw_line in raw_lines:
+                line = raw_line.decode('utf-8', errors='ignore').strip()
+                if line:
+                    if DEBUG_SPELLS and "lance le sort" in line:
+                        _logger.debug("LogParser emitting spell line: %s...", line[:80])
+                    lines.append(line)
+            if lines:
+                self.log_updated.emit(lines)
+    
+    def stop_parsing(self):
+        """Stop parsing once the lines already queued have been handled"""
+        self.line_queue.put(None)
+
+class PositionsSaveTask(QRunnable):
+    """Write a positions snapshot to the config file off the GUI thread"""
+    
+    def __init__(self, config_file, positions):
+        super().__init__()
+        self.config_file = config_file
+        self.positions = positions
+    
+    def run(self):
+        _write_positions(self.config_file, self.positions)
 
 class OutlinedLabel(QLabel):
     """QLabel with outlined text (white text with black border)"""
     
+    # Pens shared by every label, and resource colors resolved once per resource text
+    OUTLINE_PEN = QPen(QColor(0, 0, 0, 255), 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+    TEXT_PEN = QPen(QColor(255, 255, 255), 1)
+    resource_pens = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.text_to_draw = ""
+        self.number_part = ""
+        self.resource_part = ""
+        self._text_cache = {}  # text -> pre-rendered outlined QPixmap
+        self._part_widths = {}  # number/resource text -> rendered width
+        
+        # Font sizes - make them closer in size for better alignment
+        self.font_large = QFont('Segoe UI', 9, QFont.Weight.Bold)  # Larger font for numbers
+        self.font_small = QFont('Segoe UI', 8, QFont.Weight.Bold)  # Smaller font for resource types (increased from 7)
     
     def setText(self, text):
         """Override setText to store text and trigger repaint"""
+        if text == self.text_to_draw:
+            return  # Same text: nothing to re-split or repaint
         self.text_to_draw = text
+        # Split once here (e.g. "1PA" -> "1" and "PA") instead of on every render
+        self.number_part, self.resource_part = _NUM_RES_RE.match(text).groups()
         super().setText(text)
         self.update()
     
+    def get_resource_pen(self, text):
+        """Get the (cached) pen drawing a resource type in its color"""
+        pen = self.resource_pens.get(text)
+        if pen is None:
+            pen = QPen(self.get_resource_color(text), 1)
+            self.resource_pens[text] = pen
+        return pen
+    
     def get_resource_color(self, text):
         """Get color based on resource type"""
         if "PA" in text:
@@ -115,31 +343,46 @@ class OutlinedLabel(QLabel):
             return QColor(255, 255, 255)  # Default white
     
     def paintEvent(self, event):
-        """Custom paint event to draw outlined text with colored resource types"""
+        """Custom paint event blitting the cached outlined text"""
         if not self.text_to_draw:
             return
         
+        pixmap = self._text_cache.get(self.text_to_draw)
+        if pixmap is None:
+            if len(self._text_cache) >= 64:
+                self._text_cache.clear()
+            pixmap = self.render_text_pixmap(self.number_part, self.resource_part)
+            self._text_cache[self.text_to_draw] = pixmap
+        
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+    
+    def resizeEvent(self, event):
+        """Drop cached renders, they are sized to the label"""
+        self._text_cache.clear()
+        super().resizeEvent(event)
+    
+    def part_width(self, metrics, part):
+        """Get the (cached) rendered width of a number or resource text"""
+        width = self._part_widths.get(part)
+        if width is None:
+            width = metrics.boundingRect(part).width() if part else 0
+            self._part_widths[part] = width
+        return width
+    
+    def render_text_pixmap(self, number_part, resource_part):
+        """Render outlined text with colored resource types into a transparent pixmap"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Parse text to separate number from resource type
-        text = self.text_to_draw
-        number_part = ""
-        resource_part = ""
-        
-        # Extract number and resource type (e.g., "1PA" -> "1" and "PA")
-        for i, char in enumerate(text):
-            if char.isdigit():
-                number_part += char
-            else:
-                resource_part = text[i:]
-                break
-        
-        # Font sizes - make them closer in size for better alignment
-        font_size_large = 9  # Larger font for numbers
-        font_size_small = 8  # Smaller font for resource types (increased from 7)
-        font_large = QFont('Segoe UI', font_size_large, QFont.Weight.Bold)
-        font_small = QFont('Segoe UI', font_size_small, QFont.Weight.Bold)
+        font_large = self.font_large
+        font_small = self.font_small
         
         # Calculate metrics for both fonts
         painter.setFont(font_large)
@@ -148,8 +391,8 @@ class OutlinedLabel(QLabel):
         metrics_small = painter.fontMetrics()
         
         # Calculate total width of the entire text
-        number_width = metrics_large.boundingRect(number_part).width() if number_part else 0
-        resource_width = metrics_small.boundingRect(resource_part).width() if resource_part else 0
+        number_width = self.part_width(metrics_large, number_part)
+        resource_width = self.part_width(metrics_small, resource_part)
         total_width = number_width + resource_width
         
         # Center the entire text block
@@ -162,14 +405,14 @@ class OutlinedLabel(QLabel):
             current_x = start_x
             
             # Draw black outline for number
-            painter.setPen(QPen(QColor(0, 0, 0, 255), 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin))
+            painter.setPen(self.OUTLINE_PEN)
             for dx in [-1, 0, 1]:
                 for dy in [-1, 0, 1]:
                     if dx != 0 or dy != 0:
                         painter.drawText(current_x + dx, y + dy, number_part)
             
             # Draw number in white
-            painter.setPen(QPen(QColor(255, 255, 255), 1))
+            painter.setPen(self.TEXT_PEN)
             painter.drawText(current_x, y, number_part)
         
         # Draw resource part (smaller font) - positioned right after the number with small gap
@@ -179,16 +422,18 @@ class OutlinedLabel(QLabel):
             resource_x = start_x + number_width + 1  # Add 1 pixel gap
             
             # Draw black outline for resource
-            painter.setPen(QPen(QColor(0, 0, 0, 255), 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin))
+            painter.setPen(self.OUTLINE_PEN)
             for dx in [-1, 0, 1]:
                 for dy in [-1, 0, 1]:
                     if dx != 0 or dy != 0:
                         painter.drawText(resource_x + dx, y + dy, resource_part)
             
             # Draw resource part in appropriate color
-            resource_color = self.get_resource_color(resource_part)
-            painter.setPen(QPen(resource_color, 1))
+            painter.setPen(self.get_resource_pen(resource_part))
             painter.drawText(resource_x, y, resource_part)
+        
+        painter.end()
+        return pixmap
 
 class preyIcon(QLabel):
     """Custom tracker icon with fade animation support"""
@@ -201,20 +446,21 @@ class preyIcon(QLabel):
     
     def setFadeAlpha(self, alpha):
         """Set the fade alpha value (0.0 to 1.0)"""
-        self.fade_alpha = max(0.0, min(1.0, alpha))
-        self.update()  # Trigger repaint
+        alpha = max(0.0, min(1.0, alpha))
+        if alpha != self.fade_alpha:
+            self.fade_alpha = alpha
+            self.update()  # Trigger repaint
     
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Fully faded out or no icon yet: nothing to blit, skip the painter altogether
+        if self.fade_alpha <= 0.0 or not self._pixmap:
+            return
         
+        painter = QPainter(self)
         # Set opacity based on fade alpha
         painter.setOpacity(self.fade_alpha)
-        
-        # Draw the icon itself
-        if self._pixmap:
-            painter.drawPixmap(3, 3, self._pixmap)
-        
+        # Blit the pre-scaled icon; it is drawn 1:1, so no smoothing hint is needed
+        painter.drawPixmap(3, 3, self._pixmap)
         painter.end()
     
     def setPixmap(self, pixmap):
@@ -233,20 +479,21 @@ class rageIcon(QLabel):
     
     def setFadeAlpha(self, alpha):
         """Set the fade alpha value (0.0 to 1.0)"""
-        self.fade_alpha = max(0.0, min(1.0, alpha))
-        self.update()  # Trigger repaint
+        alpha = max(0.0, min(1.0, alpha))
+        if alpha != self.fade_alpha:
+            self.fade_alpha = alpha
+            self.update()  # Trigger repaint
     
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Fully faded out or no icon yet: nothing to blit, skip the painter altogether
+        if self.fade_alpha <= 0.0 or not self._pixmap:
+            return
         
+        painter = QPainter(self)
         # Set opacity based on fade alpha
         painter.setOpacity(self.fade_alpha)
-        
-        # Draw the icon itself
-        if self._pixmap:
-            painter.drawPixmap(3, 3, self._pixmap)
-        
+        # Blit the pre-scaled icon; it is drawn 1:1, so no smoothing hint is needed
+        painter.drawPixmap(3, 3, self._pixmap)
         painter.end()
     
     def setPixmap(self, pixmap):
@@ -266,21 +513,41 @@ class rageProgressBar(QProgressBar):
         self.animation_frame = 0
         self.showing_red = False
         self.red_animation_frames = 0
+        self._text_cache = {}  # "NN/100" -> pre-rendered outlined QPixmap
         
         # Smooth transition variables
         self.transition_speed = 0.12  # How fast the bar moves toward target (smooth for high FPS)
         self.is_transitioning = False
         
-        # Separate high-frequency timer for progress bar only
-        self.progress_timer = QTimer()
-        self.progress_timer.timeout.connect(self.update_animation)
-        self.progress_timer.start(16)  # ~60 FPS for smooth progress bar only
+        # No timer of its own: the tracker window's shared frame tick calls
+        # update_animation while needs_animation() is true
         
         # Animation variables for gradient progression
         self.gradient_animation_speed = 0.02
         self.gradient_offset = 0
         self.gradient_phase = 0
         
+        # Painting resources, built once and reused by every paintEvent
+        self.gradient = QLinearGradient(0, 0, 250, 0)
+        self.gradient_tiers = (
+            # Low rage: Cool blue tones
+            ((0, QColor(64, 181, 246), 200),      # Light blue
+             (1, QColor(33, 150, 243), 255)),     # Blue
+            # Medium rage: Blue to cyan transition
+            ((0, QColor(33, 150, 243), 220),      # Blue
+             (0.5, QColor(0, 188, 212), 240),     # Cyan
+             (1, QColor(0, 172, 193), 255)),      # Dark cyan
+            # High rage: Cyan to electric blue
+            ((0, QColor(0, 172, 193), 240),       # Dark cyan
+             (0.5, QColor(3, 169, 244), 255),     # Electric blue
+             (1, QColor(0, 123, 255), 255)),      # Bright blue
+        )
+        self.background_color = QColor(0, 0, 0, 77)  # Semi-transparent black
+        self.border_pen = QPen(QColor(51, 51, 51, 255), 2)
+        self.text_font = QFont('Segoe UI', 16, QFont.Weight.Bold)
+        self.outline_pen = QPen(QColor(0, 0, 0), 3)
+        self.text_pen = QPen(QColor(255, 255, 255), 1)
+        
         self.setFixedHeight(24)
         self.setFixedWidth(250)
         self.setRange(0, 100)
@@ -303,6 +570,26 @@ class rageProgressBar(QProgressBar):
             self.red_animation_frames = 30  # Show red for 30 frames
         
         super().setValue(int(self.target_value))
+        
+        # Nothing to animate off screen: jump straight to the target
+        if not self.isVisible():
+            self.settle()
+    
+    def settle(self):
+        """Finish any value transition and red flash immediately"""
+        self.decimal_value = self.target_value
+        self.is_transitioning = False
+        self.showing_red = False
+        self.red_animation_frames = 0
+    
+    def hideEvent(self, event):
+        """Stop animating while hidden, so the shared frame tick can go idle"""
+        self.settle()
+        super().hideEvent(event)
+    
+    def needs_animation(self):
+        """Whether a value transition or the red flash is still playing"""
+        return self.is_transitioning or self.showing_red or self.red_animation_frames > 0
     
     def update_animation(self):
         """Update gradient animation and smooth value transitions"""
@@ -323,6 +610,12 @@ class rageProgressBar(QProgressBar):
                 # Move toward target at the specified speed
                 self.decimal_value += difference * self.transition_speed
         
+        # Count down the red flash
+        if self.red_animation_frames > 0:
+            self.red_animation_frames -= 1
+            if self.red_animation_frames == 0:
+                self.showing_red = False
+        
         self.update()
     
     
@@ -335,42 +628,62 @@ class rageProgressBar(QProgressBar):
         progress = self.decimal_value / 100.0
         bar_width = int(self.width() * progress)
         
-        # Create animated gradient based on progress
-        gradient = QLinearGradient(0, 0, self.width(), 0)
-        
+        # Update the animated gradient based on progress
         if progress < 0.3:
-            # Low rage: Cool blue tones
-            gradient.setColorAt(0, QColor(64, 181, 246, int(200 * self.gradient_offset)))      # Light blue
-            gradient.setColorAt(1, QColor(33, 150, 243, int(255 * self.gradient_offset)))     # Blue
+            tier_stops = self.gradient_tiers[0]
         elif progress < 0.7:
-            # Medium rage: Blue to cyan transition
-            gradient.setColorAt(0, QColor(33, 150, 243, int(220 * self.gradient_offset)))     # Blue
-            gradient.setColorAt(0.5, QColor(0, 188, 212, int(240 * self.gradient_offset)))    # Cyan
-            gradient.setColorAt(1, QColor(0, 172, 193, int(255 * self.gradient_offset)))     # Dark cyan
+            tier_stops = self.gradient_tiers[1]
         else:
-            # High rage: Cyan to electric blue
-            gradient.setColorAt(0, QColor(0, 172, 193, int(240 * self.gradient_offset)))     # Dark cyan
-            gradient.setColorAt(0.5, QColor(3, 169, 244, int(255 * self.gradient_offset)))   # Electric blue
-            gradient.setColorAt(1, QColor(0, 123, 255, int(255 * self.gradient_offset)))     # Bright blue
+            tier_stops = self.gradient_tiers[2]
+        stops = []
+        for position, color, max_alpha in tier_stops:
+            color.setAlpha(int(max_alpha * self.gradient_offset))
+            stops.append((position, color))
+        self.gradient.setStops(stops)
         
         # Draw background
-        painter.fillRect(0, 0, self.width(), self.height(), QColor(0, 0, 0, 77))  # Semi-transparent black
+        painter.fillRect(0, 0, self.width(), self.height(), self.background_color)
         
         # Draw animated progress bar
         if bar_width > 0:
-            painter.fillRect(0, 0, bar_width, self.height(), QBrush(gradient))
+            painter.fillRect(0, 0, bar_width, self.height(), QBrush(self.gradient))
         
         # Draw border
-        painter.setPen(QPen(QColor(51, 51, 51, 255), 2))
+        painter.setPen(self.border_pen)
         painter.drawRect(0, 0, self.width()-1, self.height()-1)
         
-        # Set font
-        font = QFont('Segoe UI', 16, QFont.Weight.Bold)
-        painter.setFont(font)
-        
         # Get text - use decimal_value for accurate display
         text = f"{round(self.decimal_value)}/100"
         
+        # Draw the outlined text, rendered once per distinct value
+        text_pixmap = self._text_cache.get(text)
+        if text_pixmap is None:
+            if len(self._text_cache) >= 128:
+                self._text_cache.clear()
+            text_pixmap = self.render_text_pixmap(text)
+            self._text_cache[text] = text_pixmap
+        painter.drawPixmap(0, 0, text_pixmap)
+        
+        painter.end()
+    
+    def resizeEvent(self, event):
+        """Drop cached text renders and stretch the gradient, both are sized to the bar"""
+        self._text_cache.clear()
+        self.gradient.setFinalStop(self.width(), 0)
+        super().resizeEvent(event)
+    
+    def render_text_pixmap(self, text):
+        """Render centered outlined text into a transparent pixmap the size of the bar"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        painter.setFont(self.text_font)
+        
         # Get text metrics
         metrics = painter.fontMetrics()
         text_rect = metrics.boundingRect(text)
@@ -380,17 +693,18 @@ class rageProgressBar(QProgressBar):
         y = (self.height() + text_rect.height()) // 2 - metrics.descent()
         
         # Draw black outline (border)
-        painter.setPen(QPen(QColor(0, 0, 0), 3))
+        painter.setPen(self.outline_pen)
         for dx in [-2, -1, 0, 1, 2]:
             for dy in [-2, -1, 0, 1, 2]:
                 if dx != 0 or dy != 0:
                     painter.drawText(x + dx, y + dy, text)
         
         # Draw white text
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
+        painter.setPen(self.text_pen)
         painter.drawText(x, y, text)
         
         painter.end()
+        return pixmap
         
     def get_minimal_style(self):
         """Get transparent style since we're using custom painting"""
@@ -460,14 +774,7 @@ class WakfuOugiResourceTracker(QMainWindow):
         # Resource tracking variables
         self.rage = 0
         self.tracker = 0
-        self.tracker = 0
         self.prey = False
-        self.rage = 0
-        self.current_rage = 0
-        self.current_tracker = 0
-        self.current_tracker = 0
-        self.current_prey = False
-        self.current_rage = 0
         
         # Préparation Damage Confirmation System
         self.pending_rage_loss = False  # True when waiting for damage confirmation
@@ -484,19 +791,36 @@ class WakfuOugiResourceTracker(QMainWindow):
         # Turn-based visibility system
         self.is_ougi_turn = False  # Track if it's currently the Iop's turn
         self.overlay_visible = False  # Track if overlay should be visible
-        self.iop_spells = ["Épée céleste", "Fulgur", "Super Iop Punch", "Jugement", "Colère de Iop", 
-                          "Ébranler", "Roknocerok", "Fendoir", "Ravage", "Jabs", "Rafale", 
-                          "Torgnole", "Tannée", "Épée de Iop", "Bond", "Focus", "Éventrail", "Uppercut",
-                          "Amplification", "Duel", "Étendard de bravoure", "Vertu", "Charge"]
+        # Frozenset: checked on every spell cast line, so membership must be a hashed lookup
+        self.ougi_spells = frozenset([
+            "Émeute", "Fléau", "Rupture", "Plombage", "Balafre",  # Water spells
+            "Croc-en-jambe", "Bastonnade", "Molosse", "Hachure", "Saccade",  # Earth spells
+            "Balayage", "Contusion", "Cador", "Brise'Os", "Baroud",  # Wind spells
+            "Chasseur", "Élan", "Canine", "Apaisement", "Poursuite", "Meute",  # Neutral spells
+            "Proie", "Ougigarou", "Chienchien", "Poursuivant",  # Innate spells
+        ])
         
         # Duplicate prevention system
-        self.processed_lines = set()  # Track processed log lines to prevent duplicates
+        self.processed_lines = OrderedDict()  # Hashes of recently processed log lines, oldest first
+        self.processed_lines_max = 4096
         
         # Turn tracking
         self.last_spell_caster = None  # Track the last player who cast a spell
-        self.last_etendard_cast = False  # Track if Étendard de bravoure was just cast
-        self.last_bond_cast = False  # Track if Bond was just cast
-        self.last_charge_cast = False  # Track if Charge was just cast
+        # Per-spell side effects for the tracked player's casts; new spells are one entry here
+        self.spell_handlers = {
+            "Étendard de bravoure": self.on_etendard_cast,
+        }
+        # Combat line handlers in priority order, called with the message after _COMBAT_PREFIX:
+        # the first one whose keyword is in it and that returns True consumes the line, so each line costs one keyword scan instead of every branch
+        self.line_handlers = (
+            ("rage (+", self.on_rage_line),
+            ("pour le tour suivant", self.on_turn_end_line),
+            ("tracker (+", self.on_tracker_level_line),
+            ("n'est plus sous l'emprise de 'tracker'", self.on_tracker_loss_line),
+            ("(tracker)", self.on_tracker_damage_line),
+            ("Préparation (+", self.on_preparation_line),
+            (" PV", self.on_damage_line),
+        )
         
         # Animation variables
         self.animation_frame = 0
@@ -549,14 +873,26 @@ class WakfuOugiResourceTracker(QMainWindow):
         self.last_tracker_state = 0  # Track last tracker state
         self.last_rage_state = 0  # Track last rage state
         self.last_tracker_hidden_debug = False  # Track if tracker hidden debug was printed
-        self.last_tracker_hidden_debug = False  # Track if tracker hidden debug was printed
         self.last_rage_hidden_debug = False  # Track if rage hidden debug was printed
 
+        # Widget visibility as last applied, so show()/hide() only run on transitions
+        self.overlay_shown = False
+        self.timeline_shown = False
+        self.timeline_dirty = True  # Timeline labels out of date with timeline_entries
+        self.tracker_bars_shown = 0
+        self.widgets_shown = {'tracker': False, 'rage': False, 'prey': False}  # Icon groups, see set_group_visible
+
         # Cast timeline (last 5 casts by tracked player)
         self.timeline_max_slots = 5
-        self.timeline_entries = []  # list[{ 'spell': str, 'icon': QPixmap, 'cost': str }]
+        # deque[{ 'spell': str, 'pixmap': QPixmap, 'cost': str }]; one extra slot lets the oldest animate out,
+        # anything older is dropped by maxlen on append
+        self.timeline_entries = deque(maxlen=self.timeline_max_slots + 1)
         self.timeline_icon_labels = []
         self.timeline_cost_labels = []
+        self.timeline_slot_entries = [None] * self.timeline_max_slots  # Entry each slot's labels currently show
+        self.timeline_slot_opacity = [1.0] * self.timeline_max_slots  # Opacity last applied to each slot's effects
+        # Timeline cost per spell; none listed yet, so casts stay off the timeline until Ougi costs are added
+        self.spell_cost_map = {}
         self.spell_icon_stem_map = {
             "Épée céleste": "epeeceleste",
             "Fulgur": "fulgur",
@@ -594,7 +930,12 @@ class WakfuOugiResourceTracker(QMainWindow):
         self.rage_icon_path = self.base_path / "img" / "rage.png"
         self.tracker_icon_path = self.base_path / "img" / "Couroux.png"
         self.prey_icon_path = self.base_path / "img" / "tracker.png"
-        self.rage_icon_path = self.base_path / "img" / "rage.png"
+        # Per-spell (compact cost, 32px icon or None) for the timeline, resolved once so a cast is a single lookup
+        self.timeline_spell_cache = {}
+        for spell_key, cost in self.spell_cost_map.items():
+            icon_path = self.base_path / "img" / f"{self.spell_icon_stem_map[spell_key]}.png"
+            pixmap = _load_scaled_pixmap(str(icon_path), 32, 32) if icon_path.exists() else None
+            self.timeline_spell_cache[spell_key] = (cost.replace(" ", ""), pixmap)  # e.g., "1 PA" -> "1PA"
         
         # Log file path
         # Log file path - use default Wakfu logs location
@@ -604,12 +945,24 @@ class WakfuOugiResourceTracker(QMainWindow):
         # Position saving
         self.positions_locked = False
         self.config_file = self.base_path / "positions_config.json"
-        self.auto_save_timer = None
+        # One single-shot timer for delayed saves; every restart pushes the save back
+        self.auto_save_timer = QTimer(self)
+        self.auto_save_timer.setSingleShot(True)
+        self.auto_save_timer.timeout.connect(self.save_positions)
+        # Saves are written on a single worker so they land on disk in the order they were taken
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
         self.drag_start_position = QPoint()
-        self.dragging_rage = False
-        self.dragging_rage = False
+        self.dragging_rage_bar = False
+        self.dragging_rage_icon = False
+        # Latest drag target, applied at most once per frame so high-rate mice don't relayout per event
+        self.pending_drag_pos = None
+        self.drag_timer = QTimer(self)
+        self.drag_timer.setSingleShot(True)
+        self.drag_timer.timeout.connect(self.apply_drag)
         self.rage_offset_x = 0  # Offset for rage icon from rage bar
         self.rage_offset_y = 0
+        self.layout_dirty = True  # Static element positions need recomputing (bar moved / offsets changed)
         
         self.setup_ui()
         self.setup_log_monitoring()
@@ -660,8 +1013,7 @@ class WakfuOugiResourceTracker(QMainWindow):
         self.rage_icon.setParent(main_widget)
         
         if self.rage_icon_path.exists():
-            pixmap = QPixmap(str(self.rage_icon_path))
-            self.rage_icon.setPixmap(pixmap.scaled(28, 28, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            self.rage_icon.setPixmap(_load_scaled_pixmap(str(self.rage_icon_path), 28, 28))
             self.rage_icon.setStyleSheet("background-color: transparent;")
         else:
             self.rage_icon.setText("🐶")
@@ -678,16 +1030,24 @@ class WakfuOugiResourceTracker(QMainWindow):
         self.rage_bar = rageProgressBar()
         self.rage_bar.setParent(main_widget)
         
+        # Anchor for every widget that follows the rage bar at a fixed offset: moving it moves
+        # them all. The bar's top-left sits at (anchor_bar_x, anchor_bar_y) inside it, leaving
+        # room for the prey icon above and the timeline slide-in on the left
+        self.anchor_bar_x = 20
+        self.anchor_bar_y = 80
+        self.anchor = QWidget(main_widget)
+        self.anchor.setFixedSize(320, 160)
+        self.anchor.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        
         # tracker icon (positioned absolutely, initially hidden)
         self.tracker_icon = QLabel()
         self.tracker_icon.setFixedSize(28, 28)
         self.tracker_icon.setScaledContents(True)
-        self.tracker_icon.setParent(main_widget)
+        self.tracker_icon.setParent(self.anchor)
         self.tracker_icon.hide()
         
         if self.tracker_icon_path.exists():
-            pixmap = QPixmap(str(self.tracker_icon_path))
-            self.tracker_icon.setPixmap(pixmap.scaled(28, 28, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            self.tracker_icon.setPixmap(_load_scaled_pixmap(str(self.tracker_icon_path), 28, 28))
             self.tracker_icon.setStyleSheet("background-color: transparent;")
         else:
             self.tracker_icon.setText("⚡")
@@ -700,11 +1060,12 @@ class WakfuOugiResourceTracker(QMainWindow):
                 }
             """)
         
-        # tracker counter (positioned absolutely, initially hidden)
+        # tracker counter (child of the icon, so it rides along with every icon move; initially hidden)
         self.tracker_counter = OutlinedLabel()
         self.tracker_counter.setFixedSize(28, 28)
         self.tracker_counter.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.tracker_counter.setParent(main_widget)
+        self.tracker_counter.setParent(self.tracker_icon)
+        self.tracker_counter.move(0, 0)
         self.tracker_counter.hide()
         
         # Préparation icon (positioned absolutely, initially hidden)
@@ -715,8 +1076,7 @@ class WakfuOugiResourceTracker(QMainWindow):
         self.rage_icon.hide()
         
         if self.rage_icon_path.exists():
-            pixmap = QPixmap(str(self.rage_icon_path))
-            self.rage_icon.setPixmap(pixmap.scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            self.rage_icon.setPixmap(_load_scaled_pixmap(str(self.rage_icon_path), 40, 40))
             self.rage_icon.setStyleSheet("background-color: transparent;")
         else:
             self.rage_icon.setText("📋")
@@ -729,11 +1089,12 @@ class WakfuOugiResourceTracker(QMainWindow):
                 }
             """)
         
-        # Préparation counter (positioned absolutely, initially hidden)
+        # Préparation counter (child of the icon, so it rides along with every icon move; initially hidden)
         self.rage_counter = OutlinedLabel()
         self.rage_counter.setFixedSize(40, 40)
         self.rage_counter.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.rage_counter.setParent(main_widget)
+        self.rage_counter.setParent(self.rage_icon)
+        self.rage_counter.move(0, 0)
         self.rage_counter.hide()
         
         # tracker bars (2 small bars, initially hidden)
@@ -741,14 +1102,9 @@ class WakfuOugiResourceTracker(QMainWindow):
         for i in range(2):
             bar = QFrame()
             bar.setFixedSize(30, 6)  # Small horizontal bars
-            bar.setParent(main_widget)
-            bar.setStyleSheet("""
-                QFrame {
-                    background-color: rgba(255, 255, 255, 30);
-                    border: 1px solid rgba(255, 255, 255, 50);
-                    border-radius: 3px;
-                }
-            """)
+            bar.setParent(self.anchor)
+            # Bars are only ever visible lit, so the bright style is applied once here
+            bar.setStyleSheet(_TRACKER_BAR_STYLE)
             bar.hide()
             self.tracker_bars.append(bar)
         
@@ -756,13 +1112,11 @@ class WakfuOugiResourceTracker(QMainWindow):
         self.prey_icon = preyIcon()
         self.prey_icon.setFixedSize(24, 24)
         self.prey_icon.setScaledContents(True)
-        self.prey_icon.setParent(main_widget)
+        self.prey_icon.setParent(self.anchor)
         self.prey_icon.hide()
         
         if self.prey_icon_path.exists():
-            pixmap = QPixmap(str(self.prey_icon_path))
-            scaled_pixmap = pixmap.scaled(18, 18, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            self.prey_icon.setPixmap(scaled_pixmap)
+            self.prey_icon.setPixmap(_load_scaled_pixmap(str(self.prey_icon_path), 18, 18))
         else:
             # Fallback to emoji if image not found
             self.prey_icon.setText("🎯")
@@ -779,23 +1133,29 @@ class WakfuOugiResourceTracker(QMainWindow):
         for _ in range(self.timeline_max_slots):
             # Icon label
             icon_label = QLabel()
-            icon_label.setParent(main_widget)
+            icon_label.setParent(self.anchor)
             icon_label.setFixedSize(32, 32)
             icon_label.setScaledContents(True)
             icon_label.setStyleSheet("background-color: transparent;")
+            # Fade effect attached once here; the timeline refresh only changes its opacity
+            icon_label._opacity = QGraphicsOpacityEffect(icon_label)
+            icon_label.setGraphicsEffect(icon_label._opacity)
             icon_label.hide()
             self.timeline_icon_labels.append(icon_label)
 
             # Cost label below the icon using outlined white text
             cost_label = OutlinedLabel()
-            cost_label.setParent(main_widget)
+            cost_label.setParent(self.anchor)
             cost_label.setFixedSize(32, 16)  # Give it a proper size
             cost_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             cost_label.setStyleSheet("background-color: transparent;")
+            cost_label._opacity = QGraphicsOpacityEffect(cost_label)
+            cost_label.setGraphicsEffect(cost_label._opacity)
             cost_label.hide()
             self.timeline_cost_labels.append(cost_label)
         
         # Position elements (will be updated when visible)
+        self.layout_anchor()
         self.position_elements()
         
         # Initially hide all elements since we start out of combat
@@ -807,61 +1167,131 @@ class WakfuOugiResourceTracker(QMainWindow):
     def position_elements(self):
         """Position all elements on screen"""
         # Get rage bar position
-        base_x = self.rage_bar.x()
-        base_y = self.rage_bar.y()
+        rage_bar_pos = self.rage_bar.pos()
+        base_x, base_y = rage_bar_pos.x(), rage_bar_pos.y()
         
-        # Position rage icon (left of bar)
-        self.rage_icon.move(base_x - 35, base_y - 2)
-        
-        # Position tracker icon (right of bar)
-        self.tracker_icon.move(base_x + 255, base_y - 2)
+        # Everything at a fixed offset from the bar follows it through the anchor
+        self.anchor.move(base_x - self.anchor_bar_x, base_y - self.anchor_bar_y)
         
-        # Position tracker counter (on top of tracker icon)
-        self.tracker_counter.move(base_x + 255, base_y - 2)
+        # Position rage icon (right of tracker + offset); its counter is a child and follows.
+        # The rage icon stays off the anchor since it can be dragged anywhere; keep its resting
+        # spot so the animation tick only adds its slide and bounce to it
+        self.rage_icon_home = QPoint(base_x + 290 + self.rage_offset_x, base_y - 2 + self.rage_offset_y)
+        self.rage_icon.move(self.rage_icon_home)
         
-        # Position rage icon (right of tracker + offset)
-        self.rage_icon.move(base_x + 290 + self.rage_offset_x, base_y - 2 + self.rage_offset_y)
+        self.layout_dirty = False
+    
+    def layout_anchor(self):
+        """Place the anchored widgets at their offsets from the rage bar, once"""
+        base_x, base_y = self.anchor_bar_x, self.anchor_bar_y
         
-        # Position rage counter (on top of rage icon)
-        self.rage_counter.move(base_x + 290 + self.rage_offset_x, base_y - 2 + self.rage_offset_y)
+        # Position tracker icon, and with it its counter (right of bar)
+        self.tracker_icon.move(base_x + 255, base_y - 2)
         
         # Position tracker bars (on top of rage bar)
         for i, bar in enumerate(self.tracker_bars):
             bar_x = base_x + (i * 35)  # 35px spacing between bars
             bar_y = base_y - 15  # 15px above the rage bar
             bar.move(bar_x, bar_y)
+        
+        # Position prey icon (well above the first tracker bar)
+        self.prey_icon.move(base_x, base_y - 50)
 
-        # Position tracker icon (well above the first tracker bar - 10/50)
-        tracker_x = base_x  # Same X position as first tracker bar
-        # Apply slide-in offset during fade-in (start slightly above and slide down)
-        slide_offset = getattr(self, 'tracker_slide_offset', 0)
-        tracker_y = base_y - 50 - slide_offset
-        self.tracker_icon.move(tracker_x, tracker_y)
-
-        # Position timeline slots relative to rage bar
-        timeline_icon_y = base_y + 30  # icons row
+        # Position timeline slots relative to rage bar; the slot coordinates are kept for the
+        # timeline refresh, which only adds the newest entry's slide offset to them
         slot_spacing = 32  # no gap between icons (same as icon width)
-        icon_w, icon_h = 32, 32
-        for i in range(self.timeline_max_slots):
-            icon_x = base_x + (i * slot_spacing)
-            # Icon position
-            self.timeline_icon_labels[i].move(icon_x, timeline_icon_y)
-            # Cost label below icon, centered horizontally
-            cost_x = icon_x + (icon_w - 32) // 2  # Center the 32px wide cost label under the 32px icon
-            cost_y = timeline_icon_y + icon_h - 2
-            self.timeline_cost_labels[i].move(cost_x, cost_y)
+        icon_h = 32
+        self.timeline_icon_y = base_y + 30  # icons row
+        self.timeline_cost_y = self.timeline_icon_y + icon_h - 2  # Cost label below icon
+        # The 32px wide cost label sits exactly under the 32px icon, so both share the slot x
+        self.timeline_slot_x = [base_x + (i * slot_spacing) for i in range(self.timeline_max_slots)]
+        for i, slot_x in enumerate(self.timeline_slot_x):
+            self.timeline_icon_labels[i].move(slot_x, self.timeline_icon_y)
+            self.timeline_cost_labels[i].move(slot_x, self.timeline_cost_y)
     
     def setup_log_monitoring(self):
         """Setup log file monitoring"""
-        self.log_monitor = LogMonitorThread(self.log_file_path)
-        self.log_monitor.log_updated.connect(self.parse_log_line)
+        # Reader -> parser hand-off of per-read line batches; bounded so a large log dump cannot pile up in memory
+        self.log_queue = queue.Queue(maxsize=256)
+        self.log_parser = LogParserThread(self.log_queue)
+        self.log_parser.log_updated.connect(self.on_log_lines)
+        self.log_parser.start()
+        self.log_monitor = LogMonitorThread(self.log_file_path, self.log_queue)
         self.log_monitor.start()
     
     def setup_animations(self):
-        """Setup animation timers"""
+        """Setup the shared frame tick driving every animation"""
+        # One ~60 FPS timer for the whole overlay: the rage bar steps every frame,
+        # the overlay animations every 3rd frame (their speeds are tuned for ~20 FPS)
+        self.frame_tick = 0
+        self.overlay_dirty = True  # State changed since the last overlay frame
         self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self.update_animations)
-        self.animation_timer.start(50)  # 20 FPS (back to original)
+        self.animation_timer.timeout.connect(self.tick_animations)
+        self.wake_animations()
+    
+    def wake_animations(self):
+        """(Re)start the frame tick so the next frame applies the current state"""
+        self.overlay_dirty = True
+        if not self.animation_timer.isActive():
+            self.frame_tick = 2  # Make the first frame an overlay frame
+            self.animation_timer.start(16)
+    
+    def tick_animations(self):
+        """Advance all animations by one frame, stopping the tick once everything is at rest"""
+        if self.rage_bar.needs_animation():
+            self.rage_bar.update_animation()
+        
+        self.frame_tick += 1
+        if self.frame_tick < 3:
+            return
+        self.frame_tick = 0
+        # Overlay frames only run on a state change or while an overlay animation is in flight;
+        # a rage bar transition alone does not need them
+        if self.overlay_dirty or self.overlay_animations_active():
+            self.overlay_dirty = False
+            self.update_animations()
+        
+        if not self.animations_active():
+            self.animation_timer.stop()
+    
+    def animations_active(self):
+        """Whether any animation still needs frames"""
+        return self.rage_bar.needs_animation() or self.overlay_animations_active()
+    
+    def overlay_animations_active(self):
+        """Whether an overlay animation (bounce, slide, fade, timeline) still needs frames"""
+        # Icons that are off screen never hold the tick alive
+        if self.tracker_bounce_velocity != 0 and self.tracker_icon.isVisible():
+            return True
+        if self.rage_icon.isVisible():
+            if self.rage_slide_offset > 0:
+                return True
+            if self.rage > 0 and self.rage_bounce_loop_active:
+                return True
+        if self.prey_fade_alpha != self.prey_target_alpha or self.prey_slide_offset > 0:
+            return True
+        if self.timeline_entries:
+            if len(self.timeline_entries) > self.timeline_max_slots:
+                return True
+            newest = self.timeline_entries[-1]
+            if newest.get('alpha', 0.0) < 1.0 or newest.get('slide', 0) < 0:
+                return True
+        return False
+    
+    def show_overlay(self):
+        """Mark the overlay visible and let the frame tick bring it on screen"""
+        self.overlay_visible = True
+        self.wake_animations()
+    
+    def hide_overlay(self):
+        """Mark the overlay hidden; the frame tick stops once the fade-outs are done"""
+        self.overlay_visible = False
+        self.wake_animations()
+    
+    def on_log_lines(self, lines):
+        """Parse a batch of log lines, then make sure the overlay picks up the new state"""
+        self.parse_log_lines(lines)
+        self.wake_animations()
     
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -877,486 +1307,416 @@ class WakfuOugiResourceTracker(QMainWindow):
         force_close_action.triggered.connect(lambda: sys.exit(0))
         self.addAction(force_close_action)
     
+    def mark_line_processed(self, line_hash):
+        """Remember a processed line, forgetting the oldest one once the limit is reached"""
+        self.processed_lines[line_hash] = None
+        if len(self.processed_lines) > self.processed_lines_max:
+            self.processed_lines.popitem(last=False)
+    
+    def parse_log_lines(self, lines):
+        """Parse a batch of log lines in file order"""
+        for line in lines:
+            self.parse_log_line(line)
+    
     def parse_log_line(self, line):
         """Parse log line for Ougir resources"""
         try:
-            # Prevent duplicate processing of the same spell cast within a short time window
-            # Extract the core content without timestamp for spell lines
-            if "lance le sort" in line:
-                # Extract player and spell info for duplicate detection
-                spell_match = re.search(r'\[Information \(combat\)\] ([^:]+)[:\s]+lance le sort ([^(]+)', line)
-                if spell_match:
-                    player_name = spell_match.group(1).strip()
-                    spell_name = spell_match.group(2).strip()
-                    
-                    # Use line hash for duplicate detection (same log line = duplicate)
-                    line_hash = hash(line.strip())
-                    if line_hash in self.processed_lines:
-                        print(f"DEBUG: Skipping duplicate log line: {line.strip()[:50]}...")
-                        return
-                    
-                    # Record this log line as processed
-                    self.processed_lines.add(line_hash)
-                    print(f"DEBUG: Processing new spell cast: {player_name}:{spell_name}")
-                else:
-                    # Fallback to line hash for non-spell lines
-                    line_hash = hash(line.strip())
-                    if line_hash in self.processed_lines:
-                        print(f"DEBUG: Skipping duplicate line: {line.strip()[:50]}...")
-                        return
-                    self.processed_lines.add(line_hash)
-            else:
-                # For non-spell lines, use line hash
-                line_hash = hash(line.strip())
-                if line_hash in self.processed_lines:
-                    print(f"DEBUG: Skipping duplicate line: {line.strip()[:50]}...")
-                    return
-                self.processed_lines.add(line_hash)
+            # Cheap substring prefilter before any hashing or regex work: only combat lines,
+            # combat end and the Sac à patate markers can change the tracker state
+            _, combat_prefix, message = line.partition(_COMBAT_PREFIX)
+            is_combat_line = bool(combat_prefix)
+            if not is_combat_line and "Combat terminé" not in line and "Sac à patate" not in line:
+                return
+            
+            # Prevent duplicate processing: the same log line twice is a duplicate. Lines arrive
+            # already stripped, so the str is hashed as is (CPython caches the hash on it)
+            line_hash = hash(line)
+            if line_hash in self.processed_lines:
+                _logger.debug("Skipping duplicate line: %s...", line[:50])
+                return
+            self.mark_line_processed(line_hash)
             
-            # Keep only the last 1000 processed lines to prevent memory issues
-            if len(self.processed_lines) > 1000:
-                # Remove oldest entries (this is a simple approach)
-                self.processed_lines = set(list(self.processed_lines)[-500:])
             # Check for Sac à patate combat start (check this FIRST - works on any line type)
             if "Sac à patate" in line and ("Quand tu auras fini de me frapper" in line or "abandonner" in line or "Abandonne le combat" in line):
                 self.is_sac_patate_combat = True
             
             # Check for combat start and Iop turn detection - CONSOLIDATED SPELL PROCESSING
             if "lance le sort" in line:
-                # Extract player name for spell cast lines; supports both "Name: lance le sort" and "Name lance le sort"
-                player_spell_match = re.search(r'\[Information \(combat\)\]\s+([^:]+):\s+lance le sort', line)
-                if not player_spell_match:
-                    player_spell_match = re.search(r'\[Information \(combat\)\]\s+([^:]+)\s+lance le sort', line)
-
-                # Extract spell name for debug purposes
-                spell_name_match = re.search(r'lance le sort ([^\(\n]+)', line)
-                spell_name = spell_name_match.group(1).strip() if spell_name_match else "?"
-
-                # Extract caster name
-                caster_name = None
-                if player_spell_match:
-                    caster_name = player_spell_match.group(1).strip()
-                    # Track the last player who cast a spell (for turn end detection)
-                    self.last_spell_caster = caster_name
-
-                # Check if this is an Ougi spell (regardless of who casts it)
-                is_ougi_spell = spell_name in self.ougi_spells
-
-                # Turn-based visibility logic - handle first Ougi spell
-                if is_ougi_spell:
-                    # If no tracked player yet, set it to this caster (first Ougi spell)
-                    if not self.tracked_player_name:
-                        self.tracked_player_name = caster_name
-                        print(f"DEBUG: Tracked player set to {self.tracked_player_name} on Ougi spell '{spell_name}'")
-                
-                # Determine if this cast is by the tracked player (after potentially setting tracked_player_name)
-                is_tracked_caster = False
-                if caster_name and self.tracked_player_name:
-                    is_tracked_caster = (caster_name.strip() == self.tracked_player_name.strip())
-                
-                timestamp = time.strftime("%H:%M:%S")
-                print(f"DEBUG [{timestamp}]: Spell cast detected - caster='{caster_name}', spell='{spell_name}', tracked='{self.tracked_player_name}', is_tracked={is_tracked_caster}, is_ougi_spell={is_ougi_spell}")
-
-                # Initialize tracker only once per combat, when transitioning into combat due to the tracked player's first cast
-                if not self.in_combat and is_tracked_caster:
-                    self.in_combat = True
-                    self.tracker = 0
-                    self.current_tracker = 0
-                    print("DEBUG: Combat started by tracked player; tracker initialized to 0")
-                else:
-                    # Still mark combat as active, but do not reinitialize tracker
-                    self.in_combat = True
-                
-                # Show overlay immediately when Ougi spell is cast by tracked player
-                if is_ougi_spell and is_tracked_caster:
-                    self.is_ougi_turn = True
-                    self.overlay_visible = True
-                    print(f"DEBUG: Ougi turn started - overlay shown for '{spell_name}'")
-
-                # Handle specific spell effects for tracked player
-                if is_tracked_caster and spell_name:
-                    # Track Étendard de bravoure for cost adjustment
-                    if spell_name == "Étendard de bravoure":
-                        self.last_etendard_cast = True
-                        print(f"DEBUG: Étendard de bravoure detected - waiting for next line to determine cost")
-                    else:
-                        self.last_etendard_cast = False
-                    
-                    # Add spell to timeline
-                    self.add_spell_to_timeline(spell_name)
-                    print(f"DEBUG: Spell '{spell_name}' added to timeline for tracked player")
-                
-                # Return to prevent further processing of this line
+                self.on_spell_cast_line(line, message if is_combat_line else None)
                 return
             
             # Normal combat end: "Combat terminé, cliquez ici pour rouvrir l'écran de fin de combat."
-            if "Combat terminé" in line or "Combat terminé, cliquez ici pour rouvrir l'écran de fin de combat." in line:
-                combat_ended = True
-            
             # Exception: KO/hors-combat only triggers end for Sac à patate combat
-            elif (re.search(r'est hors-combat', line) or re.search(r'est KO !', line)) and self.is_sac_patate_combat:
-                combat_ended = True
-            
-            if combat_ended:
-                self.in_combat = False
-                self.is_sac_patate_combat = False  # Reset Sac à patate flag
-                self.is_ougi_turn = False  # Reset turn state
-                self.overlay_visible = False  # Hide overlay
-                # Reset all resources when combat ends
-                self.rage = 0
-                self.tracker = 0
-                self.prey = False
-                self.current_rage = 0
-                self.current_tracker = 0
-                self.current_prey = False
-                self.current_rage = 0
-                # Stop rage bouncing loop
-                self.rage_bounce_loop_active = False
-                self.rage_bounce_velocity = 0
-                self.rage_bounce_offset = 0
-                # Reset damage confirmation system
-                self.pending_rage_loss = False
-                self.rage_loss_caster = None
-                self.rage_loss_spell = None
-                # Clear timeline when combat ends
-                self.timeline_entries.clear()
-                self.current_turn_spells.clear()
-                # Hide all timeline elements immediately
-                for i in range(self.timeline_max_slots):
-                    self.timeline_icon_labels[i].hide()
-                    self.timeline_cost_labels[i].hide()
-                print("DEBUG: Combat ended - overlay hidden and timeline cleared")
+            if "Combat terminé" in line or (self.is_sac_patate_combat and ("est hors-combat" in line or "est KO !" in line)):
+                self.end_combat()
                 return
             
             # Only process combat lines
-            if "[Information (combat)]" not in line:
+            if not is_combat_line:
                 return
             #TODO: ougi styles
-            # Parse rage - actual format: "rage (+65 Niv.)"
-            rage_match = re.search(r'rage \(\+(\d+) Niv\.\)', line)
-            if rage_match:
-                # Extract player name from rage log
-                player_rage_match = re.search(r'\[Information \(combat\)\] ([^:]+): rage', line)
-                if player_rage_match:
-                    self.tracked_player_name = player_rage_match.group(1)
-                
-                rage_value = int(rage_match.group(1))
-                
-                # Check if rage reaches 100+ (triggers overflow and tracker loss)
-                if rage_value >= 100:
-                    # Wrap around using modulo - e.g., 140 becomes 40
-                    self.rage = rage_value % 100
-                    # Lose tracker buff when rage overflows
-                    if self.prey:
-                        self.prey = False
-                        self.current_prey = self.prey
-                        # Start fade out (animated)
-                        self.prey_target_alpha = 0.0
-                        if self.prey_visible:
-                            print("DEBUG: Égaré removed due to rage overflow")
-                            self.prey_visible = False
-                else:
-                    # Normal rage tracking
-                    self.rage = rage_value
-                return
-            
-            # Parse Égaré loss - turn passing ("seconde reportée pour le tour suivant" or "secondes reportées pour le tour suivant")
-            # This MUST be checked BEFORE tracker loss to avoid early return
-            if ("reportée pour le tour suivant" in line) or ("reportées pour le tour suivant" in line):
-                print(f"DEBUG: Turn end detected in log: {line.strip()[:80]}...")
-                
-                # Determine which player's turn is ending
-                # Use the last player who cast a spell as the turn owner
-                turn_owner = self.last_spell_caster
-                print(f"DEBUG: Turn end detected - last spell caster was: '{turn_owner}' (tracked: '{self.tracked_player_name}')")
-                
-                if turn_owner and self.tracked_player_name and turn_owner == self.tracked_player_name:
-                    # The tracked Iop is passing turn - hide overlay
-                    self.is_ougi_turn = False
-                    self.overlay_visible = False
-                    
-                    # If we were waiting for damage confirmation, cancel it
-                    if self.pending_rage_loss:
-                        self.pending_rage_loss = False
-                        self.rage_loss_caster = None
-                        self.rage_loss_spell = None
-                        print(f"DEBUG: Préparation damage confirmation cancelled - turn passed without damage")
-                    
-                    print(f"DEBUG: Iop turn ended - overlay hidden (turn passed by {turn_owner})")
-                elif turn_owner:
-                    # Different player is passing turn - overlay remains as is
-                    print(f"DEBUG: Turn passed by different player '{turn_owner}' - overlay remains {'visible' if self.overlay_visible else 'hidden'}")
-                else:
-                    # No recent spell caster - assume it's the tracked player's turn ending
-                    print(f"DEBUG: No recent spell caster - assuming tracked player's turn ending")
-                    if self.tracked_player_name:
-                        self.is_ougi_turn = False
-                        self.overlay_visible = False
-                        
-                        # If we were waiting for damage confirmation, cancel it
-                        if self.pending_rage_loss:
-                            self.pending_rage_loss = False
-                            self.rage_loss_caster = None
-                            self.rage_loss_spell = None
-                            print(f"DEBUG: Préparation damage confirmation cancelled - assumed turn end without damage")
-                        
-                        print(f"DEBUG: Iop turn ended - overlay hidden (assumed turn end)")
-                    else:
-                        print(f"DEBUG: No tracked player set - cannot determine turn owner")
-                
-                if self.prey:
-                    self.prey = False
-                    self.current_prey = self.prey
-                    # Start fade out (animated)
-                    self.prey_target_alpha = 0.0
-                    if self.prey_visible:
-                        print("DEBUG: Égaré removed due to turn carryover")
-                        self.prey_visible = False
-                
-                # Clear timeline when turn passes
-                timeline_count = len(self.timeline_entries)
-                if timeline_count > 0:
-                    print(f"DEBUG: Clearing {timeline_count} timeline entries due to turn end")
-                    self.timeline_entries.clear()
-                    # Hide all timeline elements immediately
-                    for i in range(self.timeline_max_slots):
-                        self.timeline_icon_labels[i].hide()
-                        self.timeline_cost_labels[i].hide()
-                else:
-                    print("DEBUG: Timeline already empty - no clearing needed")
+            # First handler whose keyword is in the message and that consumes it wins
+            for keyword, handler in self.line_handlers:
+                if keyword in message and handler(message):
+                    return
                 
-                return
-            
-            # Parse tracker - actual format: "tracker (+50 Niv.)"
-            tracker_match = re.search(r'tracker \(\+(\d+) Niv\.\)', line)
-            if tracker_match:
-                tracker_value = int(tracker_match.group(1))
-                self.tracker = min(tracker_value, 50)  # Cap at 50
-                # Force immediate display update
-                self.current_tracker = self.tracker
-                return
-            
-            # Parse tracker loss - "n'est plus sous l'emprise de 'tracker' (Iop isolé)"
-            if "n'est plus sous l'emprise de 'tracker' (Iop isolé)" in line:
-                # Extract player name and only apply to tracked player
-                player_tracker_loss_match = re.search(r'\[Information \(combat\)\] ([^:]+): n\'est plus sous l\'emprise de \'tracker\'', line)
-                if player_tracker_loss_match and self.tracked_player_name:
-                    player_name = player_tracker_loss_match.group(1)
-                    if player_name == self.tracked_player_name:
-                        self.tracker = max(0, self.tracker - 10)  # Lose 10 tracker, minimum 0
-                        # Force immediate display update
-                        self.current_tracker = self.tracker
-                return
-            
-            # Parse tracker gains - "tracker (+30 Niv.) (Compulsion)" OR "tracker (+1 Niv.) (rage)"
-            # Note: The number in (+X Niv.) is the TOTAL current amount, not the amount gained
-            tracker_gain_match = re.search(r'tracker \(\+(\d+) Niv\.\) \((Compulsion|rage)\)', line)
-            if tracker_gain_match:
-                tracker_total = int(tracker_gain_match.group(1))
-                old_tracker = self.tracker
-                self.tracker = min(tracker_total, 4)  # Set to the total amount shown in log, max 4 stacks
-                # Force immediate display update
-                self.current_tracker = self.tracker
-                # Trigger bounce animation when gaining tracker (only if it increased)
-                if self.tracker > old_tracker:
-                    self.trigger_tracker_bounce()
-                return
-            
-            # Parse tracker loss - "n'est plus sous l'emprise de 'tracker' (Compulsion)"
-            if "n'est plus sous l'emprise de 'tracker' (Compulsion)" in line:
-                # Extract player name and only apply to tracked player
-                player_tracker_loss_match = re.search(r'\[Information \(combat\)\] ([^:]+): n\'est plus sous l\'emprise de \'tracker\'', line)
-                if player_tracker_loss_match and self.tracked_player_name:
-                    player_name = player_tracker_loss_match.group(1)
-                    if player_name == self.tracked_player_name:
-                        self.tracker = 0  # Lose ALL stacks
-                        # Force immediate display update
-                        self.current_tracker = self.tracker
-                return
-            
-            # Note: Spell processing is now consolidated above to prevent duplicate timeline entries
+        except Exception as e:
+            # Keep the overlay alive (an exception escaping a Qt slot aborts PyQt6), but do not hide the bug
+            _logger.warning("Error parsing log line %r: %s", line[:80], e)
+    
+    def on_spell_cast_line(self, line, message):
+        """Handle a "lance le sort" line: combat start, Ougi turn and timeline"""
+        # Extract caster and spell name with a single regex; only combat lines name a caster
+        caster_name = None
+        spell_cast_match = _SPELL_CAST_RE.match(message) if message is not None else None
+        if spell_cast_match:
+            caster_name = spell_cast_match.group(1).strip()
+            spell_name = spell_cast_match.group(2).strip()
+            # Track the last player who cast a spell (for turn end detection)
+            self.last_spell_caster = caster_name
+        else:
+            # No caster found; still extract the spell name for debug purposes
+            spell_name_match = _SPELL_NAME_RE.search(line)
+            spell_name = spell_name_match.group(1).strip() if spell_name_match else "?"
+
+        # Check if this is an Ougi spell (regardless of who casts it)
+        is_ougi_spell = spell_name in self.ougi_spells
+
+        # Turn-based visibility logic - handle first Ougi spell
+        if is_ougi_spell:
+            # If no tracked player yet, set it to this caster (first Ougi spell)
+            if not self.tracked_player_name:
+                self.tracked_player_name = caster_name
+                _logger.debug("Tracked player set to %s on Ougi spell '%s'", self.tracked_player_name, spell_name)
+        
+        # Determine if this cast is by the tracked player (after potentially setting tracked_player_name)
+        is_tracked_caster = False
+        if caster_name and self.tracked_player_name:
+            is_tracked_caster = (caster_name.strip() == self.tracked_player_name.strip())
+        
+        if DEBUG_SPELLS:
+            _logger.debug("Spell cast detected - caster=%r, spell=%r, tracked=%r, is_tracked=%s, is_ougi_spell=%s",
+                          caster_name, spell_name, self.tracked_player_name, is_tracked_caster, is_ougi_spell)
+
+        # Initialize tracker only once per combat, when transitioning into combat due to the tracked player's first cast
+        if not self.in_combat and is_tracked_caster:
+            self.in_combat = True
+            self.tracker = 0
+            _logger.debug("Combat started by tracked player; tracker initialized to 0")
+        else:
+            # Still mark combat as active, but do not reinitialize tracker
+            self.in_combat = True
+        
+        # Show overlay immediately when Ougi spell is cast by tracked player
+        if is_ougi_spell and is_tracked_caster:
+            self.is_ougi_turn = True
+            self.show_overlay()
+            _logger.debug("Ougi turn started - overlay shown for '%s'", spell_name)
+
+        # Handle specific spell effects for tracked player
+        if is_tracked_caster and spell_name:
+            handler = self.spell_handlers.get(spell_name)
+            if handler:
+                handler(spell_name, line)
             
-            # Parse tracker loss - damage dealt with (tracker) tag
-            # Pattern: "[Information (combat)] monster: -xx PV (element) (tracker)"
-            if "(tracker)" in line and "PV" in line:
-                tracker_damage_match = re.search(r'\[Information \(combat\)\] .*: -(\d+) PV \([^)]+\) \(tracker\)', line)
-                if tracker_damage_match:
-                    self.tracker = 0  # Lose ALL stacks when damage is dealt with tracker
-                    # Force immediate display update
-                    self.current_tracker = self.tracker
-                    return
+            # Add spell to timeline
+            self.add_spell_to_timeline(spell_name)
+            _logger.debug("Spell '%s' added to timeline for tracked player", spell_name)
+    
+    def end_combat(self):
+        """Reset all combat state and hide the overlay"""
+        self.in_combat = False
+        self.is_sac_patate_combat = False  # Reset Sac à patate flag
+        self.is_ougi_turn = False  # Reset turn state
+        self.hide_overlay()
+        # Reset all resources when combat ends
+        self.rage = 0
+        self.tracker = 0
+        self.prey = False
+        # Stop rage bouncing loop
+        self.rage_bounce_loop_active = False
+        self.rage_bounce_velocity = 0
+        self.rage_bounce_offset = 0
+        # Reset damage confirmation system
+        self.pending_rage_loss = False
+        self.rage_loss_caster = None
+        self.rage_loss_spell = None
+        # Clear timeline when combat ends
+        self.timeline_entries.clear()
+        # Hide all timeline elements immediately
+        self.hide_timeline()
+        _logger.debug("Combat ended - overlay hidden and timeline cleared")
+    
+    def on_rage_line(self, message):
+        """Parse rage - actual format: "rage (+65 Niv.)" """
+        rage_match = _RAGE_RE.search(message)
+        if not rage_match:
+            return False
+        # Extract player name from rage log
+        player_rage_match = _RAGE_PLAYER_RE.match(message)
+        if player_rage_match:
+            self.tracked_player_name = player_rage_match.group(1)
+        
+        rage_value = int(rage_match.group(1))
+        
+        # Rage wraps around at 100 (e.g. 140 becomes 40); below that the modulo is a no-op
+        self.rage = rage_value % 100
+        # Lose tracker buff when rage overflows
+        if rage_value >= 100 and self.prey:
+            self.prey = False
+            # Start fade out (animated)
+            self.prey_target_alpha = 0.0
+            if self.prey_visible:
+                _logger.debug("Égaré removed due to rage overflow")
+                self.prey_visible = False
+        return True
+    
+    def on_turn_end_line(self, message):
+        """Parse Égaré loss - turn passing ("seconde reportée pour le tour suivant" or "secondes reportées pour le tour suivant")"""
+        if "reportée pour le tour suivant" not in message and "reportées pour le tour suivant" not in message:
+            return False
+        _logger.debug("Turn end detected in log: %s...", message[:80])
+        
+        # Determine which player's turn is ending
+        # Use the last player who cast a spell as the turn owner
+        turn_owner = self.last_spell_caster
+        _logger.debug("Turn end detected - last spell caster was: '%s' (tracked: '%s')", turn_owner, self.tracked_player_name)
+        
+        if turn_owner and self.tracked_player_name and turn_owner == self.tracked_player_name:
+            # The tracked Iop is passing turn - hide overlay
+            self.is_ougi_turn = False
+            self.hide_overlay()
             
-            # Parse Préparation gains - "Belluya: Préparation (+20 Niv.)"
-            rage_gain_match = re.search(r'Préparation \(\+(\d+) Niv\.\)', line)
-            if rage_gain_match:
-                rage_total = int(rage_gain_match.group(1))
-                old_rage = self.rage
-                self.rage = rage_total  # Set to the total amount shown in log
-                # Force immediate display update
-                self.current_rage = self.rage
-                # Trigger slide animation when gaining rage (only if it increased)
-                if self.rage > old_rage:
-                    self.trigger_rage_slide()
-                print(f"DEBUG: Préparation gained: {rage_total} stacks")
-                return
+            # If we were waiting for damage confirmation, cancel it
+            if self.pending_rage_loss:
+                self.pending_rage_loss = False
+                self.rage_loss_caster = None
+                self.rage_loss_spell = None
+                _logger.debug("Préparation damage confirmation cancelled - turn passed without damage")
             
-            # Parse damage lines - "Sac à patates: -64 PV  (Feu)" or "Sac à patates: -133 PV (Feu) (tracker)"
-            damage_match = re.search(r'\[Information \(combat\)\] ([^:]+):\s*-(\d+)\s*PV', line)
-            if damage_match and self.pending_rage_loss:
-                damage_target = damage_match.group(1).strip()
-                damage_amount = int(damage_match.group(2))
-                
-                print(f"DEBUG: Damage detected: {damage_amount} PV to {damage_target} (waiting for: {self.rage_loss_caster})")
+            _logger.debug("Iop turn ended - overlay hidden (turn passed by %s)", turn_owner)
+        elif turn_owner:
+            # Different player is passing turn - overlay remains as is
+            _logger.debug("Turn passed by different player '%s' - overlay remains %s", turn_owner, 'visible' if self.overlay_visible else 'hidden')
+        else:
+            # No recent spell caster - assume it's the tracked player's turn ending
+            _logger.debug("No recent spell caster - assuming tracked player's turn ending")
+            if self.tracked_player_name:
+                self.is_ougi_turn = False
+                self.hide_overlay()
                 
-                # Check if this damage is from the tracked player's spell
-                if self.rage_loss_caster == self.tracked_player_name:
-                    # Damage confirmed - remove Préparation
-                    self.rage = 0
-                    self.current_rage = self.rage
-                    # Stop continuous bouncing loop
-                    self.rage_bounce_loop_active = False
-                    self.rage_bounce_velocity = 0
-                    self.rage_bounce_offset = 0
-                    # Reset damage confirmation system
+                # If we were waiting for damage confirmation, cancel it
+                if self.pending_rage_loss:
                     self.pending_rage_loss = False
                     self.rage_loss_caster = None
                     self.rage_loss_spell = None
-                    print(f"DEBUG: Préparation lost due to confirmed damage: {damage_amount} PV to {damage_target}")
-                    return
-                else:
-                    print(f"DEBUG: Damage detected but not from tracked player - caster: {self.rage_loss_caster}, tracked: {self.tracked_player_name}")
+                    _logger.debug("Préparation damage confirmation cancelled - assumed turn end without damage")
                 
-        except Exception as e:
-            pass  # Silently handle parsing errors
+                _logger.debug("Iop turn ended - overlay hidden (assumed turn end)")
+            else:
+                _logger.debug("No tracked player set - cannot determine turn owner")
+        
+        if self.prey:
+            self.prey = False
+            # Start fade out (animated)
+            self.prey_target_alpha = 0.0
+            if self.prey_visible:
+                _logger.debug("Égaré removed due to turn carryover")
+                self.prey_visible = False
+        
+        # Clear timeline when turn passes
+        timeline_count = len(self.timeline_entries)
+        if timeline_count > 0:
+            _logger.debug("Clearing %s timeline entries due to turn end", timeline_count)
+            self.timeline_entries.clear()
+            # Hide all timeline elements immediately
+            self.hide_timeline()
+        else:
+            _logger.debug("Timeline already empty - no clearing needed")
+        
+        return True
+    
+    def on_tracker_level_line(self, message):
+        """Parse tracker - actual format: "tracker (+50 Niv.)" """
+        tracker_match = _TRACKER_RE.search(message)
+        if tracker_match:
+            tracker_value = int(tracker_match.group(1))
+            self.tracker = min(tracker_value, 50)  # Cap at 50
+            return True
+        
+        # Parse tracker gains - "tracker (+30 Niv.) (Compulsion)" OR "tracker (+1 Niv.) (rage)"
+        # Note: The number in (+X Niv.) is the TOTAL current amount, not the amount gained
+        tracker_gain_match = _TRACKER_GAIN_RE.search(message)
+        if tracker_gain_match:
+            tracker_total = int(tracker_gain_match.group(1))
+            old_tracker = self.tracker
+            self.tracker = min(tracker_total, 4)  # Set to the total amount shown in log, max 4 stacks
+            # Trigger bounce animation when gaining tracker (only if it increased)
+            if self.tracker > old_tracker:
+                self.trigger_tracker_bounce()
+            return True
+        return False
+    
+    def on_tracker_loss_line(self, message):
+        """Parse tracker loss - "n'est plus sous l'emprise de 'tracker' (Iop isolé)" or "(Compulsion)" """
+        if "(Iop isolé)" in message:
+            loss_all = False  # Lose 10 tracker
+        elif "(Compulsion)" in message:
+            loss_all = True  # Lose ALL stacks
+        else:
+            return False
+        # Extract player name and only apply to tracked player
+        player_tracker_loss_match = _TRACKER_LOSS_PLAYER_RE.match(message)
+        if player_tracker_loss_match and self.tracked_player_name:
+            player_name = player_tracker_loss_match.group(1)
+            if player_name == self.tracked_player_name:
+                self.tracker = 0 if loss_all else max(0, self.tracker - 10)  # Minimum 0
+        return True
+    
+    def on_tracker_damage_line(self, message):
+        """Parse tracker loss - "[Information (combat)] monster: -xx PV (element) (tracker)" """
+        if "PV" not in message or not _TRACKER_DAMAGE_RE.match(message):
+            return False
+        self.tracker = 0  # Lose ALL stacks when damage is dealt with tracker
+        return True
+    
+    def on_preparation_line(self, message):
+        """Parse Préparation gains - "Belluya: Préparation (+20 Niv.)" """
+        rage_gain_match = _PREPARATION_RE.search(message)
+        if not rage_gain_match:
+            return False
+        rage_total = int(rage_gain_match.group(1))
+        old_rage = self.rage
+        self.rage = rage_total  # Set to the total amount shown in log
+        # Trigger slide animation when gaining rage (only if it increased)
+        if self.rage > old_rage:
+            self.trigger_rage_slide()
+        _logger.debug("Préparation gained: %s stacks", rage_total)
+        return True
+    
+    def on_damage_line(self, message):
+        """Parse damage lines - "Sac à patates: -64 PV  (Feu)" or "Sac à patates: -133 PV (Feu) (tracker)" """
+        damage_match = _DAMAGE_RE.match(message) if self.pending_rage_loss else None
+        if not damage_match:
+            return False
+        damage_target = damage_match.group(1).strip()
+        damage_amount = int(damage_match.group(2))
+        
+        _logger.debug("Damage detected: %s PV to %s (waiting for: %s)", damage_amount, damage_target, self.rage_loss_caster)
+        
+        # Check if this damage is from the tracked player's spell
+        if self.rage_loss_caster != self.tracked_player_name:
+            _logger.debug("Damage detected but not from tracked player - caster: %s, tracked: %s", self.rage_loss_caster, self.tracked_player_name)
+            return False
+        # Damage confirmed - remove Préparation
+        self.rage = 0
+        # Stop continuous bouncing loop
+        self.rage_bounce_loop_active = False
+        self.rage_bounce_velocity = 0
+        self.rage_bounce_offset = 0
+        # Reset damage confirmation system
+        self.pending_rage_loss = False
+        self.rage_loss_caster = None
+        self.rage_loss_spell = None
+        _logger.debug("Préparation lost due to confirmed damage: %s PV to %s", damage_amount, damage_target)
+        return True
     
     def update_animations(self):
         """Update animations and visual effects"""
         self.animation_frame += 1
         
         # Show/hide overlay based on turn-based visibility (only during ougi's turn)
+        # Widgets are only shown/hidden on transitions, not re-shown/re-hidden every frame
         if self.overlay_visible and self.in_combat:
-            self.rage_icon.show()
-            self.rage_bar.show()
-            self.position_elements()  # Ensure elements are positioned
-            # Show timeline slots that have entries
-            self.update_timeline_display()
+            if not self.overlay_shown:
+                # The rage icon group is shown by the rage display update below
+                self.rage_bar.show()
+                self.overlay_shown = True
+            if self.layout_dirty:
+                self.position_elements()
+            # Show timeline slots that have entries, when they changed since the last refresh
+            if self.timeline_dirty:
+                self.update_timeline_display()
 
         else:
-            self.rage_icon.hide()
-            self.rage_bar.hide()
-            self.tracker_icon.hide()
-            self.tracker_counter.hide()
-            # Hide all tracker bars when not Iop's turn
-            for bar in self.tracker_bars:
-                bar.hide()
+            if self.overlay_shown:
+                self.set_group_visible('rage', False, self.rage_icon, self.rage_counter)
+                self.rage_bar.hide()
+                self.set_group_visible('tracker', False, self.tracker_icon, self.tracker_counter)
+                self.overlay_shown = False
+            # Tracker bars are hidden by the tracker bar update below
             # Target fade out for tracker icon, but keep processing fade animation below (no early return)
             self.prey_target_alpha = 0.0
             # Hide timeline when not Iop's turn
-            for i in range(self.timeline_max_slots):
-                self.timeline_icon_labels[i].hide()
-                self.timeline_cost_labels[i].hide()
-        
-        # Direct value updates for responsive display
-        self.current_rage = self.rage
-        self.current_tracker = self.tracker
-        self.current_tracker = self.tracker
-        self.current_prey = self.prey
+            self.hide_timeline()
         
         # Update rage bar with smooth transitions
         if self.rage != self.rage_bar.target_value:
-            self.rage_bar.setValue(self.current_rage)
+            self.rage_bar.setValue(self.rage)
         
-        # Progress bar has its own high-frequency timer, no need to update here
+        # The rage bar itself is stepped every frame by tick_animations
         
         # Update tracker bars (show bars based on tracker level) - only when overlay is visible
         if self.overlay_visible and self.in_combat:
-            bars_to_show = min(5, self.current_tracker // 10)  # Each bar represents 10 tracker
+            bars_to_show = min(5, self.tracker // 10)  # Each bar represents 10 tracker
             if bars_to_show > 0:
                 # Only print debug message when state changes
                 if bars_to_show != self.last_tracker_bars_state:
-                    print(f"DEBUG: tracker bars showing - tracker: {self.current_tracker}, bars: {bars_to_show}, overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
+                    _dbg(lambda: f"tracker bars showing - tracker: {self.tracker}, bars: {bars_to_show}, overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
                     self.last_tracker_bars_state = bars_to_show
                 # Reset hidden debug flag when bars become visible
                 self.last_tracker_hidden_debug = False
-            for i, bar in enumerate(self.tracker_bars):
-                if i < bars_to_show:
-                    bar.show()
-                    # Light up the bar with a bright color
-                    bar.setStyleSheet("""
-                        QFrame {
-                            background-color: rgba(100, 200, 255, 200);
-                            border: 1px solid rgba(150, 220, 255, 255);
-                            border-radius: 3px;
-                        }
-                    """)
-                else:
-                    bar.hide()
+            self.show_tracker_bars(bars_to_show)
         else:
             # Hide all tracker bars when overlay is not visible
-            if self.current_tracker > 0 and not self.last_tracker_hidden_debug:
-                print(f"DEBUG: tracker bars hidden despite having tracker - overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
+            if self.tracker > 0 and not self.last_tracker_hidden_debug:
+                _dbg(lambda: f"tracker bars hidden despite having tracker - overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
                 self.last_tracker_hidden_debug = True
-            for bar in self.tracker_bars:
-                bar.hide()
+            self.show_tracker_bars(0)
             # Reset state tracking when hidden
             self.last_tracker_bars_state = 0
         
         # Update tracker display - only show if we have stacks AND overlay is visible
-        if self.current_tracker > 0 and self.overlay_visible and self.in_combat:
-            self.tracker_icon.show()
-            self.tracker_counter.setText(str(int(self.current_tracker)))
-            self.tracker_counter.show()
+        if self.tracker > 0 and self.overlay_visible and self.in_combat:
+            self.set_group_visible('tracker', True, self.tracker_icon, self.tracker_counter)
+            self.tracker_counter.setText(str(int(self.tracker)))
             # Only print debug message when state changes
-            if self.current_tracker != self.last_tracker_state:
-                print(f"DEBUG: tracker showing - stacks: {self.current_tracker}, overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
-                self.last_tracker_state = self.current_tracker
+            if self.tracker != self.last_tracker_state:
+                _dbg(lambda: f"tracker showing - stacks: {self.tracker}, overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
+                self.last_tracker_state = self.tracker
             # Reset hidden debug flag when tracker becomes visible
             self.last_tracker_hidden_debug = False
             
-            # Realistic bouncing physics for tracker icon
-            # Apply gravity to velocity
-            self.tracker_bounce_velocity += self.tracker_bounce_gravity
-            
-            # Update position based on velocity
-            self.tracker_bounce_offset += self.tracker_bounce_velocity
-            
-            # Check for ground collision (bounce)
-            if self.tracker_bounce_offset >= self.tracker_ground_level:
-                # Hit the ground - reverse velocity and apply damping
-                self.tracker_bounce_offset = self.tracker_ground_level
-                self.tracker_bounce_velocity = -self.tracker_bounce_velocity * self.tracker_bounce_damping
-                
-                # Stop bouncing if velocity is too small
-                if abs(self.tracker_bounce_velocity) < self.tracker_bounce_min_velocity:
-                    self.tracker_bounce_velocity = 0
-                    self.tracker_bounce_offset = self.tracker_ground_level
+            # Realistic bouncing physics for tracker icon; an icon resting on the ground has nothing to integrate
+            if self.tracker_bounce_velocity != 0 or self.tracker_bounce_offset != self.tracker_ground_level:
+                self.tracker_bounce_offset, self.tracker_bounce_velocity, _ = _step_bounce(
+                    self.tracker_bounce_offset, self.tracker_bounce_velocity, self.tracker_bounce_gravity,
+                    self.tracker_bounce_damping, self.tracker_bounce_min_velocity, self.tracker_ground_level)
             
-            # Apply bounce offset to tracker icon position
-            base_x, base_y = self.rage_bar.pos().x(), self.rage_bar.pos().y()
+            # Apply bounce offset to tracker icon position (anchor coordinates)
+            base_x, base_y = self.anchor_bar_x, self.anchor_bar_y
             tracker_x = int(base_x + 255)
             tracker_y = int(base_y - 2 + self.tracker_bounce_offset)  # Positive offset = UP from ground level
             
-            # Move both icon and counter together
-            self.tracker_icon.move(tracker_x, tracker_y)
-            self.tracker_counter.move(tracker_x, tracker_y)  # Counter follows the icon
+            # Move the icon (its counter is a child), only while the bounce actually shifts it
+            if tracker_y != self.tracker_icon.y():
+                self.tracker_icon.move(tracker_x, tracker_y)
         else:
-            self.tracker_icon.hide()
-            self.tracker_counter.hide()
-            if self.current_tracker > 0 and not self.last_tracker_hidden_debug:
-                print(f"DEBUG: tracker hidden despite having stacks - overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
+            self.set_group_visible('tracker', False, self.tracker_icon, self.tracker_counter)
+            if self.tracker > 0 and not self.last_tracker_hidden_debug:
+                _dbg(lambda: f"tracker hidden despite having stacks - overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
                 self.last_tracker_hidden_debug = True
             # Reset state tracking when hidden
             self.last_tracker_state = 0
         
         # Update rage display - always show if we have stacks (regardless of turn state)
-        if self.current_rage > 0 and self.in_combat:
-            self.rage_icon.show()
-            self.rage_counter.setText(str(int(self.current_rage)))
-            self.rage_counter.show()
+        if self.rage > 0 and self.in_combat:
+            self.set_group_visible('rage', True, self.rage_icon, self.rage_counter)
+            self.rage_counter.setText(str(int(self.rage)))
             # Only print debug message when state changes
-            if self.current_rage != self.last_rage_state:
-                print(f"DEBUG: Préparation showing - stacks: {self.current_rage}, overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
-                self.last_rage_state = self.current_rage
+            if self.rage != self.last_rage_state:
+                _dbg(lambda: f"Préparation showing - stacks: {self.rage}, overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}")
+                self.last_rage_state = self.rage
             # Reset hidden debug flag when rage becomes visible
             self.last_rage_hidden_debug = False
             
@@ -1367,28 +1727,29 @@ class WakfuOugiResourceTracker(QMainWindow):
                 if self.rage_slide_offset < 0:
                     self.rage_slide_offset = 0
             
-            # Apply slide offset to rage icon position
-            base_x, base_y = self.rage_bar.pos().x(), self.rage_bar.pos().y()
-            rage_x = int(base_x + 290 + self.rage_offset_x)
-            rage_y = int(base_y - 2 + self.rage_offset_y - self.rage_slide_offset + self.rage_bounce_offset)  # Slide + bounce offset
+            # Apply slide offset to rage icon position, from its resting spot next to the bar
+            if self.layout_dirty:
+                self.position_elements()
+            rage_x = self.rage_icon_home.x()
+            rage_y = int(self.rage_icon_home.y() - self.rage_slide_offset + self.rage_bounce_offset)  # Slide + bounce offset
             
-            # Move both icon and counter together
-            self.rage_icon.move(rage_x, rage_y)
-            self.rage_counter.move(rage_x, rage_y)  # Counter follows the icon
+            # Move the icon (its counter is a child), only when the position actually changed
+            rage_pos = QPoint(rage_x, rage_y)
+            if rage_pos != self.rage_icon.pos():
+                self.rage_icon.move(rage_pos)
         else:
-            self.rage_icon.hide()
-            self.rage_counter.hide()
-            if self.current_rage > 0 and not self.in_combat and not self.last_rage_hidden_debug:
-                print(f"DEBUG: Préparation hidden due to combat end - stacks: {self.current_rage}")
+            self.set_group_visible('rage', False, self.rage_icon, self.rage_counter)
+            if self.rage > 0 and not self.in_combat and not self.last_rage_hidden_debug:
+                _dbg(lambda: f"Préparation hidden due to combat end - stacks: {self.rage}")
                 self.last_rage_hidden_debug = True
             # Reset state tracking when hidden
             self.last_rage_state = 0
         
         # Apply bounce animation for rage icon (continuous loop) - ALWAYS runs when rage exists
-        if self.current_rage > 0 and self.rage_bounce_loop_active:
-            # Only print debug occasionally to avoid spam
-            if self.animation_frame % 30 == 0:  # Every 30 frames (0.5 seconds at 60fps)
-                print(f"DEBUG: Préparation bouncing active - stacks: {self.current_rage}, overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}, loop_delay: {self.rage_bounce_loop_delay}, bounce_delay: {self.rage_bounce_delay}, velocity: {self.rage_bounce_velocity}, offset: {self.rage_bounce_offset}")
+        if self.rage > 0 and self.rage_bounce_loop_active:
+            # Only log debug occasionally to avoid spam; the constant check comes first so release builds skip the mask too
+            if DEBUG_TRACKER and (self.animation_frame & 31) == 0:  # Every 32 animation frames
+                _dbg(lambda: f"Préparation bouncing active - stacks: {self.rage}, overlay_visible: {self.overlay_visible}, in_combat: {self.in_combat}, loop_delay: {self.rage_bounce_loop_delay}, bounce_delay: {self.rage_bounce_delay}, velocity: {self.rage_bounce_velocity}, offset: {self.rage_bounce_offset}")
             # Handle delay between bounce loops
             if self.rage_bounce_loop_delay > 0:
                 self.rage_bounce_loop_delay -= 1
@@ -1402,51 +1763,39 @@ class WakfuOugiResourceTracker(QMainWindow):
                     self.trigger_rage_bounce()
             # Handle active bouncing
             elif self.rage_bounce_velocity != 0 or self.rage_bounce_offset != 0:
-                # Apply gravity to velocity
-                self.rage_bounce_velocity += self.rage_bounce_gravity
-                
-                # Update position based on velocity
-                self.rage_bounce_offset += self.rage_bounce_velocity
-                
-                # Check for ground collision (bounce)
-                if self.rage_bounce_offset >= self.rage_bounce_ground_level:
-                    # Hit the ground - reverse velocity and apply damping
-                    self.rage_bounce_offset = self.rage_bounce_ground_level
-                    self.rage_bounce_velocity = -self.rage_bounce_velocity * self.rage_bounce_damping
-                    
-                    # Stop bouncing if velocity is too small
-                    if abs(self.rage_bounce_velocity) < self.rage_bounce_min_velocity:
-                        self.rage_bounce_velocity = 0
-                        self.rage_bounce_offset = self.rage_bounce_ground_level
-                        # Start delay for next bounce loop
-                        self.rage_bounce_loop_delay = self.rage_bounce_loop_delay_max
-                        print("DEBUG: Préparation bounce sequence ended - starting loop delay")
+                self.rage_bounce_offset, self.rage_bounce_velocity, settled = _step_bounce(
+                    self.rage_bounce_offset, self.rage_bounce_velocity, self.rage_bounce_gravity,
+                    self.rage_bounce_damping, self.rage_bounce_min_velocity, self.rage_bounce_ground_level)
+                if settled:
+                    # Start delay for next bounce loop
+                    self.rage_bounce_loop_delay = self.rage_bounce_loop_delay_max
+                    _dbg(lambda: "Préparation bounce sequence ended - starting loop delay")
             # If none of the above conditions are met, start bouncing immediately
             else:
-                print("DEBUG: Préparation bouncing conditions not met - starting bounce immediately")
+                _dbg(lambda: "Préparation bouncing conditions not met - starting bounce immediately")
                 self.trigger_rage_bounce()
             
             # Bounce offset is now applied in the rage display logic above to avoid duplicate positioning
         
         # Update tracker icon with fade animation (only during Iop's turn)
-        if self.current_prey and self.overlay_visible and self.in_combat:
+        if self.prey and self.overlay_visible and self.in_combat:
             # Set target alpha to 1.0 for fade in (only when it's Iop's turn)
             self.prey_target_alpha = 1.0
-            self.prey_icon.show()
+            self.set_group_visible('prey', True, self.prey_icon)
             if not self.prey_visible:
-                print("DEBUG: Égaré icon showing (fade in)")
+                _dbg(lambda: "Égaré icon showing (fade in)")
                 self.prey_visible = True
                 # Initialize slide-in from above
                 self.prey_slide_offset = self.prey_slide_max
                 # Start fade from 0 to make animation visible
                 self.prey_fade_alpha = 0.0
             
-            # Position tracker icon well above the first Tracker bar
-            base_x, base_y = self.rage_bar.pos().x(), self.rage_bar.pos().y()
+            # Position tracker icon well above the first Tracker bar (anchor coordinates)
+            base_x, base_y = self.anchor_bar_x, self.anchor_bar_y
             prey_x = base_x  # Same X position as first Tracker bar
             prey_y = base_y - 50  # Much higher up above the Tracker bars
             self.prey_icon.move(prey_x, prey_y)
-        elif not self.current_prey:
+        elif not self.prey:
             # Set target alpha to 0.0 for fade out (when tracker is lost)
             self.prey_target_alpha = 0.0
         elif not self.overlay_visible:
@@ -1469,8 +1818,8 @@ class WakfuOugiResourceTracker(QMainWindow):
         if self.prey_target_alpha > 0.0 and self.prey_fade_alpha > 0.0 and self.prey_slide_offset > 0:
             self.prey_slide_offset = max(0, self.prey_slide_offset - self.prey_slide_speed)
 
-        # Reposition tracker icon after updating slide offset and fade
-        base_x, base_y = self.rage_bar.pos().x(), self.rage_bar.pos().y()
+        # Reposition tracker icon after updating slide offset and fade (anchor coordinates)
+        base_x, base_y = self.anchor_bar_x, self.anchor_bar_y
         prey_x = base_x
         prey_y = base_y - 50 - self.prey_slide_offset
         self.prey_icon.move(prey_x, prey_y)
@@ -1480,9 +1829,9 @@ class WakfuOugiResourceTracker(QMainWindow):
         
         # Hide icon when fully faded out (always process, regardless of combat status)
         if self.prey_fade_alpha <= 0.0:
-            self.prey_icon.hide()
+            self.set_group_visible('prey', False, self.prey_icon)
             if self.prey_visible:
-                print("DEBUG: Égaré icon hidden (fully faded out)")
+                _dbg(lambda: "Égaré icon hidden (fully faded out)")
                 self.prey_visible = False
                 self.prey_slide_offset = 0
 
@@ -1492,10 +1841,13 @@ class WakfuOugiResourceTracker(QMainWindow):
             newest = self.timeline_entries[-1]
             if newest.get('alpha', 0.0) < 1.0:
                 newest['alpha'] = min(1.0, newest.get('alpha', 0.0) + 0.15)
+                self.timeline_dirty = True
             if newest.get('slide', 0) < 0:
                 newest['slide'] = min(0, newest.get('slide', 0) + 4)
+                self.timeline_dirty = True
             # If we have one extra (overflow), it's the oldest at index 0; animate out
             if len(self.timeline_entries) > self.timeline_max_slots:
+                self.timeline_dirty = True
                 oldest = self.timeline_entries[0]
                 oldest['alpha'] = max(0.0, oldest.get('alpha', 1.0) - 0.2)
                 # Use positive slide to move right
@@ -1503,30 +1855,56 @@ class WakfuOugiResourceTracker(QMainWindow):
                 # When fully faded, drop it
                 if oldest['alpha'] <= 0.0:
                     # Remove from buffer
-                    self.timeline_entries.pop(0)
-            # Refresh display to apply the updated alpha/positions
-            self.update_timeline_display()
+                    self.timeline_entries.popleft()
+            # Refresh display to apply the updated alpha/positions; a settled timeline is left as drawn
+            if self.timeline_dirty:
+                self.update_timeline_display()
 
+    def set_group_visible(self, group, visible, *widgets):
+        """Show or hide widgets that toggle together, only when the group's visibility changes"""
+        if self.widgets_shown[group] != visible:
+            self.widgets_shown[group] = visible
+            for widget in widgets:
+                widget.setVisible(visible)
+    
+    def show_tracker_bars(self, count):
+        """Light up the first `count` tracker bars and hide the rest, only when the count changes"""
+        if count == self.tracker_bars_shown:
+            return
+        self.anchor.setUpdatesEnabled(False)
+        for i, bar in enumerate(self.tracker_bars):
+            if i < count:
+                bar.show()
+            else:
+                bar.hide()
+        self.anchor.setUpdatesEnabled(True)
+        self.tracker_bars_shown = count
+    
+    def hide_timeline(self):
+        """Hide every timeline slot, skipping the widget calls when they are already hidden"""
+        self.timeline_dirty = True  # Refill the slots when the timeline shows again
+        if not self.timeline_shown:
+            return
+        # Batch the per-label repaints into one update of the anchor
+        self.anchor.setUpdatesEnabled(False)
+        for i in range(self.timeline_max_slots):
+            self.timeline_icon_labels[i].hide()
+            self.timeline_cost_labels[i].hide()
+        self.anchor.setUpdatesEnabled(True)
+        self.timeline_shown = False
+    
     def add_spell_to_timeline(self, spell_name: str):
         """Add a spell cast to the timeline (tracked player only)."""
         spell_key = spell_name.strip()
-        cost = self.spell_cost_map.get(spell_key)
-        icon_stem = self.spell_icon_stem_map.get(spell_key)
-        if not cost or not icon_stem:
+        spell_info = self.timeline_spell_cache.get(spell_key)
+        if spell_info is None:
             return  # Unknown spell; ignore
-        icon_path = self.base_path / "img" / f"{icon_stem}.png"
-        pixmap = QPixmap(str(icon_path)) if icon_path.exists() else None
+        compact_cost, pixmap = spell_info
         # Build entry with animation state
-        compact_cost = cost.replace(" ", "")  # e.g., "1 PA" -> "1PA"
         entry = { 'spell': spell_key, 'cost': compact_cost, 'pixmap': pixmap, 'alpha': 0.0, 'slide': -16 }
-        # Append and clamp to last N; mark the oldest for fade-out/slide-right if overflow
-        overflow_entry = None
-        if len(self.timeline_entries) >= self.timeline_max_slots:
-            overflow_entry = self.timeline_entries[0]
+        # Append; the deque's maxlen drops the oldest beyond the extra slot kept for animating it out
         self.timeline_entries.append(entry)
-        if len(self.timeline_entries) > self.timeline_max_slots:
-            # Keep one extra temporarily for animating out the oldest
-            self.timeline_entries = self.timeline_entries[-(self.timeline_max_slots + 1):]
+        self.timeline_dirty = True
         
         # Trigger display refresh
         self.update_timeline_display()
@@ -1536,59 +1914,66 @@ class WakfuOugiResourceTracker(QMainWindow):
         # Only update timeline if overlay is visible
         if not (self.overlay_visible and self.in_combat):
             # Hide all timeline elements if overlay is not visible
-            for i in range(self.timeline_max_slots):
-                self.timeline_icon_labels[i].hide()
-                self.timeline_cost_labels[i].hide()
+            self.hide_timeline()
             return
         
         # Ensure positions are up-to-date
-        self.position_elements()
+        if self.layout_dirty:
+            self.position_elements()
+        # Every slot below lives on the anchor: batch their repaints into one update of it
+        self.anchor.setUpdatesEnabled(False)
+        self.timeline_dirty = False
+        # Bind the per-slot lists once; the loop below touches them several times per slot
+        entries = self.timeline_entries
+        entry_count = len(entries)
+        icon_labels = self.timeline_icon_labels
+        cost_labels = self.timeline_cost_labels
+        slot_entries = self.timeline_slot_entries
+        slot_opacity = self.timeline_slot_opacity
+        slot_x = self.timeline_slot_x
+        icon_y, cost_y = self.timeline_icon_y, self.timeline_cost_y
         # Fill newest-to-oldest left-to-right (latest cast on the far left)
         for i in range(self.timeline_max_slots):
-            entry_index = len(self.timeline_entries) - 1 - i
-            if 0 <= entry_index < len(self.timeline_entries):
-                entry = self.timeline_entries[entry_index]
-                # Set cost text (outlined white, centered)
-                self.timeline_cost_labels[i].setText(entry['cost'])
-                self.timeline_cost_labels[i].show()
-                # Set icon
-                if entry['pixmap']:
-                    self.timeline_icon_labels[i].setPixmap(entry['pixmap'].scaled(32, 32, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-                else:
-                    self.timeline_icon_labels[i].setText("?")
-                self.timeline_icon_labels[i].show()
+            icon_label = icon_labels[i]
+            cost_label = cost_labels[i]
+            entry_index = entry_count - 1 - i
+            if entry_index >= 0:
+                entry = entries[entry_index]
+                # Only refill the slot when a different entry moved into it
+                if slot_entries[i] is not entry:
+                    slot_entries[i] = entry
+                    # Set cost text (outlined white, centered)
+                    cost_label.setText(entry['cost'])
+                    # Set icon
+                    if entry['pixmap']:
+                        icon_label.setPixmap(entry['pixmap'])  # Already scaled to 32px
+                    else:
+                        icon_label.setText("?")
+                cost_label.show()
+                icon_label.show()
+                self.timeline_shown = True
                 # Ensure cost overlay stays on top of the icon
-                self.timeline_icon_labels[i].raise_()
-                self.timeline_cost_labels[i].raise_()
+                icon_label.raise_()
+                cost_label.raise_()
                 # Apply opacity and slide based on entry animation state
                 # Newest (i == 0) fades in and slides from the left; oldest (if overflow) fades out and slides right
-                icon_label = self.timeline_icon_labels[i]
-                cost_label = self.timeline_cost_labels[i]
-                # Set opacity
-                if not hasattr(icon_label, '_opacity'):
-                    icon_label._opacity = QGraphicsOpacityEffect()
-                    icon_label.setGraphicsEffect(icon_label._opacity)
-                if not hasattr(cost_label, '_opacity'):
-                    cost_label._opacity = QGraphicsOpacityEffect()
-                    cost_label.setGraphicsEffect(cost_label._opacity)
-                # Determine target alpha
+                # Determine target alpha; icon and cost always share it, and it is only pushed to Qt on change
                 is_newest = (i == 0)
-                icon_label._opacity.setOpacity(min(1.0, max(0.0, entry.get('alpha', 1.0) if is_newest else 1.0)))
-                cost_label._opacity.setOpacity(min(1.0, max(0.0, entry.get('alpha', 1.0) if is_newest else 1.0)))
+                opacity = min(1.0, max(0.0, entry.get('alpha', 1.0) if is_newest else 1.0))
+                if opacity != slot_opacity[i]:
+                    slot_opacity[i] = opacity
+                    icon_label._opacity.setOpacity(opacity)
+                    cost_label._opacity.setOpacity(opacity)
                 # Apply slide offset for newest (both icon and cost move together)
                 slide_offset = entry.get('slide', 0) if is_newest else 0
-                # Always position cost relative to icon
-                base_x, base_y = self.rage_bar.pos().x(), self.rage_bar.pos().y()
-                timeline_icon_y = base_y + 30
-                icon_x = base_x + (i * 32) + slide_offset
-                icon_label.move(icon_x, timeline_icon_y)
-                # Cost below icon, centered
-                cost_x = icon_x + (32 - 32) // 2  # Center the 32px wide cost label under the 32px icon
-                cost_y = timeline_icon_y + 32 - 2
-                cost_label.move(cost_x, cost_y)
+                # Always position cost relative to icon (slot coordinates from layout_anchor)
+                icon_x = slot_x[i] + slide_offset
+                icon_label.move(icon_x, icon_y)
+                cost_label.move(icon_x, cost_y)
             else:
-                self.timeline_icon_labels[i].hide()
-                self.timeline_cost_labels[i].hide()
+                icon_label.hide()
+                cost_label.hide()
+        self.anchor.setUpdatesEnabled(True)
     
     def trigger_tracker_bounce(self):
         """Trigger a bounce animation when tracker is gained"""
@@ -1610,7 +1995,11 @@ class WakfuOugiResourceTracker(QMainWindow):
         self.rage_bounce_loop_active = True
         self.rage_bounce_loop_delay = 0  # No delay for first bounce
         
-        print("DEBUG: Préparation slide and immediate bounce loop triggered")
+        _dbg(lambda: "Préparation slide and immediate bounce loop triggered")
+    
+    def on_etendard_cast(self, spell_name, line):
+        """Trace an Étendard de bravoure cast, whose real cost is only known from the next log line"""
+        _logger.debug("%s detected - waiting for next line to determine cost", spell_name)
     
     def trigger_rage_bounce(self):
         """Trigger the actual bounce animation after delay"""
@@ -1618,51 +2007,53 @@ class WakfuOugiResourceTracker(QMainWindow):
         self.rage_bounce_velocity = -10  # Negative velocity = upward movement (faster than before)
         self.rage_bounce_offset = 0  # Start from ground level
         self.rage_bounce_delay = 0  # Clear the delay
-        print(f"DEBUG: Préparation bounce animation started - overlay_visible: {self.overlay_visible}")
+        _dbg(lambda: f"Préparation bounce animation started - overlay_visible: {self.overlay_visible}")
+    
+    def current_positions(self):
+        """Snapshot of the positions to save"""
+        return {
+            'rage_bar': {
+                'x': self.rage_bar.x(),
+                'y': self.rage_bar.y()
+            },
+            'rage_offset': {
+                'x': self.rage_offset_x,
+                'y': self.rage_offset_y
+            },
+            'positions_locked': self.positions_locked
+        }
     
     def save_positions(self):
-        """Save current positions to config file"""
-        try:
-            positions = {
-                'rage_bar': {
-                    'x': self.rage_bar.x(),
-                    'y': self.rage_bar.y()
-                },
-                'tracker_group_offset': {
-                    'x': self.tracker_group_offset_x,
-                    'y': self.tracker_group_offset_y
-                },
-                'rage_offset': {
-                    'x': self.rage_offset_x,
-                    'y': self.rage_offset_y
-                },
-                'positions_locked': self.positions_locked
-            }
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(positions, f, indent=2)
-            pass  # Positions saved silently
-        except Exception as e:
-            pass  # Silently handle save errors
+        """Save current positions to config file; the snapshot is taken here, the write happens off the GUI thread"""
+        self.save_pool.start(PositionsSaveTask(self.config_file, self.current_positions()))
     
     def load_positions(self):
         """Load positions from config file"""
-        try:
-            if self.config_file.exists():
+        if self.config_file.exists():
+            try:
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     positions = json.load(f)
-                
-                if 'rage_bar' in positions:
-                    x, y = positions['rage_bar']['x'], positions['rage_bar']['y']
-                    self.rage_bar.move(x, y)
-                
-                if 'rage_offset' in positions:
-                    self.rage_offset_x = positions['rage_offset']['x']
-                    self.rage_offset_y = positions['rage_offset']['y']
-                
-                if 'positions_locked' in positions:
-                    self.positions_locked = positions['positions_locked']
-        except Exception as e:
-            pass  # Silently handle load errors
+            except (OSError, ValueError):  # Unreadable or not JSON: keep the default positions
+                positions = {}
+            if not isinstance(positions, dict):
+                positions = {}
+            
+            # Malformed or partial entries are skipped and keep their defaults
+            rage_bar = _config_point(positions.get('rage_bar'))
+            if rage_bar:
+                self.rage_bar.move(*rage_bar)
+                self.layout_dirty = True
+            
+            rage_offset = _config_point(positions.get('rage_offset'))
+            if rage_offset:
+                self.rage_offset_x, self.rage_offset_y = rage_offset
+                self.layout_dirty = True
+            
+            positions_locked = positions.get('positions_locked')
+            if isinstance(positions_locked, bool):
+                self.positions_locked = positions_locked
+        # Let the icons follow the restored bar position
+        self.wake_animations()
     
     def mousePressEvent(self, event):
         """Handle mouse press for dragging rage bar or combo columns separately"""
@@ -1673,9 +2064,9 @@ class WakfuOugiResourceTracker(QMainWindow):
             rage_rect = self.rage_bar.geometry()
             if rage_rect.contains(click_pos):
                 self.drag_start_position = click_pos - self.rage_bar.frameGeometry().topLeft()
-                self.dragging_rage = True
+                self.dragging_rage_bar = True
 
-                print("DEBUG: Started dragging rage bar")
+                _dbg(lambda: "Started dragging rage bar")
                 return
             
             # Check if click is on rage icon
@@ -1686,71 +2077,96 @@ class WakfuOugiResourceTracker(QMainWindow):
                     rage_base_x = self.rage_bar.x() + 290 + self.rage_offset_x
                     rage_base_y = self.rage_bar.y() - 2 + self.rage_offset_y
                     self.drag_start_position = click_pos - QPoint(rage_base_x, rage_base_y)
-                    self.dragging_rage = False
-                    self.dragging_rage = True
-                    print("DEBUG: Started dragging rage icon")
+                    self.dragging_rage_icon = True
+                    _dbg(lambda: "Started dragging rage icon")
                     return
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging rage bar or tracker separately"""
         if event.buttons() == Qt.MouseButton.LeftButton and not self.positions_locked:
-            if self.dragging_rage:
-                # Move rage bar and all other elements
-                new_pos = event.globalPosition().toPoint() - self.drag_start_position
-                self.rage_bar.move(new_pos)
-                self.position_elements()
-                self.auto_save_positions()
-                print(f"DEBUG: Moving rage bar to {new_pos}")
-            elif self.dragging_rage:
-                # Move only rage icon
-                new_pos = event.globalPosition().toPoint() - self.drag_start_position
-                rage_base_x = self.rage_bar.x() + 290  # Default rage position
-                rage_base_y = self.rage_bar.y() - 2
-                
-                # Calculate new offset from rage bar
-                self.rage_offset_x = new_pos.x() - rage_base_x
-                self.rage_offset_y = new_pos.y() - rage_base_y
-                
-                # Update rage position
-                self.position_elements()
-                self.auto_save_positions()
-                print(f"DEBUG: Moving rage icon - offset: ({self.rage_offset_x}, {self.rage_offset_y})")
+            if self.dragging_rage_bar or self.dragging_rage_icon:
+                # Only the last position of each frame is applied
+                self.pending_drag_pos = event.globalPosition().toPoint() - self.drag_start_position
+                if not self.drag_timer.isActive():
+                    self.drag_timer.start(16)
+    
+    def apply_drag(self):
+        """Move the dragged element to the last pending drag position"""
+        new_pos = self.pending_drag_pos
+        if new_pos is None:
+            return
+        self.pending_drag_pos = None
+        if self.dragging_rage_bar:
+            # Move rage bar and all other elements
+            self.rage_bar.move(new_pos)
+            self.position_elements()
+            self.wake_animations()
+            self.auto_save_positions()
+            _dbg(lambda: f"Moving rage bar to {new_pos}")
+        elif self.dragging_rage_icon:
+            # Move only rage icon
+            rage_base_x = self.rage_bar.x() + 290  # Default rage position
+            rage_base_y = self.rage_bar.y() - 2
+            
+            # Calculate new offset from rage bar
+            self.rage_offset_x = new_pos.x() - rage_base_x
+            self.rage_offset_y = new_pos.y() - rage_base_y
+            
+            # Update rage position
+            self.position_elements()
+            self.wake_animations()
+            self.auto_save_positions()
+            _dbg(lambda: f"Moving rage icon - offset: ({self.rage_offset_x}, {self.rage_offset_y})")
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release to stop dragging"""
         if event.button() == Qt.MouseButton.LeftButton:
-            if self.dragging_rage:
-                print("DEBUG: Stopped dragging rage bar")
-            elif self.dragging_tracker:
-                print("DEBUG: Stopped dragging tracker icon")
-            elif self.dragging_rage:
-                print("DEBUG: Stopped dragging rage icon")
-            self.dragging_rage = False
-            self.dragging_tracker = False
-            self.dragging_rage = False
+            # Land exactly where the mouse was released
+            self.drag_timer.stop()
+            self.apply_drag()
+            if self.dragging_rage_bar:
+                _dbg(lambda: "Stopped dragging rage bar")
+            elif self.dragging_rage_icon:
+                _dbg(lambda: "Stopped dragging rage icon")
+            self.dragging_rage_bar = False
+            self.dragging_rage_icon = False
     
     def auto_save_positions(self):
         """Auto-save positions with a delay to avoid too frequent saves"""
-        if self.auto_save_timer:
-            self.auto_save_timer.stop()
-        self.auto_save_timer = QTimer()
-        self.auto_save_timer.timeout.connect(self.save_positions)
-        self.auto_save_timer.setSingleShot(True)
-        self.auto_save_timer.start(500)
+        self.auto_save_timer.start(500)  # Restarts the countdown if already pending
     
     def closeEvent(self, event):
         """Handle close event"""
-        self.save_positions()
+        self.auto_save_timer.stop()  # Saved right here instead
+        # Let pending background saves finish, then write the final positions synchronously
+        self.save_pool.waitForDone()
+        _write_positions(self.config_file, self.current_positions())
         self.log_monitor.stop_monitoring()
         self.log_monitor.wait()
-        # Stop progress bar timer
-        self.rage_bar.progress_timer.stop()
+        self.log_parser.stop_parsing()
+        self.log_parser.wait()
+        # Stop the shared frame tick
+        self.animation_timer.stop()
         event.accept()
 
+def setup_debug_logging():
+    """Send debug logging through a queue so the log/GUI threads never block on console output"""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("DEBUG [%(asctime)s]: %(message)s", "%H:%M:%S"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    _logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _logger.setLevel(logging.DEBUG)
+    listener.start()
+    return listener
+
 def main():
     """Main function"""
     app = QApplication(sys.argv)
     
+    # Debug output (--debug, or tracing with DEBUG_SPELLS/DEBUG_TRACKER); silent otherwise
+    log_listener = setup_debug_logging() if DEBUG_SPELLS or DEBUG_TRACKER or "--debug" in sys.argv else None
+    
     # Check if running in hidden mode (from launcher)
     hidden_mode = "--hidden" in sys.argv
     
@@ -1770,7 +2186,10 @@ def main():
         window.showMinimized()
     
     # Start event loop
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    if log_listener:
+        log_listener.stop()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
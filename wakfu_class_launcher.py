@@ -4,21 +4,76 @@ Wakfu Class Launcher - Main Application
 Detects Cra, Ougi and Iop players in combat and provides a menu to launch appropriate trackers
 """
 
+import os
 import sys
 import threading
-import time
+import unicodedata
 import re
 import subprocess
 import json
 import math
+import random
+import logging
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QPushButton, QFrame, QMenu, 
                             QListWidget, QListWidgetItem, QMessageBox, QScrollArea,
                             QFileDialog, QDialog, QFormLayout, QLineEdit, QProgressBar)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QPoint, QRect, QSize, QStandardPaths
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QPoint, QRect, QSize, QStandardPaths, QFileSystemWatcher
 from PyQt6.QtGui import QFont, QPalette, QColor, QPainter, QPixmap, QAction, QLinearGradient, QBrush
 
+# Log monitor tracing; silent unless the launcher is started with --debug
+_logger = logging.getLogger(__name__)
+
+# Combat log markers; spell casts are matched from the combat tag onwards
+_COMBAT_TAG = "[Information (combat)]"
+_COMBAT_END = "Combat terminé, cliquez ici pour rouvrir l'écran de fin de combat."
+# Lines without one of these byte markers can't change anything, so they are skipped undecoded
+_SPELL_CAST_BYTES = "lance le sort".encode('utf-8')
+_COMBAT_END_BYTES = _COMBAT_END.encode('utf-8')
+_SPELL_CAST_RE = re.compile(r'\[Information \(combat\)\] ([^:]+)[:\s]+lance le sort ([^(]+)')
+
+# Iop spells
+IOP_SPELLS = (
+    "Épée céleste", "Fulgur", "Super Iop Punch", "Jugement", "Colère de Iop", 
+    "Ébranler", "Roknocerok", "Fendoir", "Ravage", "Jabs", "Rafale", 
+    "Torgnole", "Tannée", "Épée de Iop", "Bond", "Focus", "Éventrail", "Uppercut"
+)
+
+# Cra spells
+CRA_SPELLS = (
+    "Flèche criblante", "Flèche fulminante", "Flèche d'immolation", 
+    "Flèche enflammée", "Flèche Ardente", "Flèche explosive", 
+    "Flèche cinglante", "Flèche perçante", "Flèche destructrice", 
+    "Flèche chercheuse", "Flèche de recul", "Flèche tempête", 
+    "Flèche harcelante", "Flèche statique", "Balise de destruction", 
+    "Balise d'alignement", "Balise de contact", "Tir précis", "Débalisage", "Eclaireur",
+    "Flèche lumineuse", "Pluie de flèches", "Roulade"
+)
+
+# Ougi spells
+OUGI_SPELLS = (
+    "Émeute", "Fléau", "Rupture", "Plombage", "Balafre", # Water spells
+    "Croc-en-jambe", "Bastonnade", "Molosse", "Hachure", "Saccade", # Earth spells
+    "Balayage", "Contusion", "Cador",  "Brise'Os", "Baroud", # Wind spells
+    "Chasseur", "Élan", "Canine", "Apaisement", "Poursuite", "Meute", # Neutral spells
+    "Proie", "Ougigarou", "Chienchien", "Poursuivant" # Innate spells
+)
+
+def _spell_key(spell_name):
+    """Normalize a spell name so accent, case, apostrophe and spacing variants compare equal"""
+    decomposed = unicodedata.normalize('NFKD', spell_name.replace('\u2019', "'"))
+    stripped = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    return ' '.join(stripped.casefold().split())
+
+# Normalized spell name -> class, built once so detecting a class is a single lookup
+_SPELL_TO_CLASS = {
+    sys.intern(_spell_key(spell)): class_name
+    for class_name, spells in (("Iop", IOP_SPELLS), ("Cra", CRA_SPELLS), ("Ougi", OUGI_SPELLS))
+    for spell in spells
+}
+_ALL_CLASSES = frozenset(_SPELL_TO_CLASS.values())
+
 class LogMonitorThread(QThread):
     """Thread for monitoring log file"""
     class_detected = pyqtSignal(str, str)  # class_name, player_name
@@ -30,8 +85,14 @@ class LogMonitorThread(QThread):
         self.log_file = Path(log_file_path)
         self.monitoring = True
         self.last_position = 0
+        self._fh = None  # Persistent binary handle, kept open between reads
+        self.pending_bytes = bytearray()  # Bytes read past the last complete line
         self.detected_classes = {}  # Store detected classes and players
         self.in_combat = False
+        self.watcher = None
+        self.retry_timer = None  # Backoff retry after a failed read, owned by the monitor thread
+        self.consecutive_errors = 0
+        self.max_errors = 5
         
         # Initialize position to end of file to ignore existing content
         self.initialize_position_to_end()
@@ -40,131 +101,189 @@ class LogMonitorThread(QThread):
         """Set the file position to the end to ignore existing content"""
         try:
             if self.log_file.exists():
-                with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    f.seek(0, 2)  # Seek to end of file
-                    self.last_position = f.tell()
-                print(f"DEBUG: Log monitor initialized at position {self.last_position} (end of file)")
+                self._fh = open(self.log_file, 'rb', buffering=0)
+                self.last_position = self._fh.seek(0, 2)  # Seek to end of file
+                _logger.debug("Log monitor initialized at position %d (end of file)", self.last_position)
             else:
-                print("DEBUG: Log file doesn't exist yet, will start from beginning when created")
+                _logger.debug("Log file doesn't exist yet, will start from beginning when created")
         except Exception as e:
-            print(f"DEBUG: Error initializing log position: {e}")
+            _logger.warning("Error initializing log position: %s", e)
             self.last_position = 0
         
     def run(self):
         """Monitor log file for changes"""
-        consecutive_errors = 0
-        max_errors = 5
-        
-        while self.monitoring:
+        # The watcher lives in this thread; direct connections keep its
+        # notifications (and the reads they trigger) off the GUI thread
+        watcher = QFileSystemWatcher()
+        watcher.fileChanged.connect(self.on_path_changed, Qt.ConnectionType.DirectConnection)
+        watcher.directoryChanged.connect(self.on_path_changed, Qt.ConnectionType.DirectConnection)
+        self.watcher = watcher
+        watching = self.watch_paths()
+        
+        # Slow safety poll: change notifications can lag on files held open by the game,
+        # and it is the only wake-up source if the watcher could not be started
+        fallback_timer = QTimer()
+        fallback_timer.timeout.connect(self.read_new_lines, Qt.ConnectionType.DirectConnection)
+        fallback_timer.start(1000)
+        if not watching:
+            _logger.debug("File watcher unavailable, falling back to 1s polling")
+        
+        # Created here (not via QTimer.singleShot on self, which would fire on the GUI thread)
+        # so backoff retries read the file on this thread like every other read
+        retry_timer = QTimer()
+        retry_timer.setSingleShot(True)
+        retry_timer.timeout.connect(self.read_new_lines, Qt.ConnectionType.DirectConnection)
+        self.retry_timer = retry_timer
+        
+        # Catch up with anything written before the event loop started
+        self.read_new_lines()
+        self.exec()
+        
+        fallback_timer.stop()
+        retry_timer.stop()
+        self.retry_timer = None
+        self.watcher = None
+        if self._fh:
+            self._fh.close()
+            self._fh = None
+    
+    def watch_paths(self):
+        """(Re)register the log file and its folder with the watcher"""
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        for path in (str(self.log_file.parent), str(self.log_file)):
+            if path not in watched and Path(path).exists():
+                self.watcher.addPath(path)
+        return bool(self.watcher.files() or self.watcher.directories())
+    
+    def on_path_changed(self, path):
+        """Handle a change notification for the log file or its folder"""
+        # A deleted/recreated file drops out of the watcher, so re-add it
+        self.watch_paths()
+        self.read_new_lines()
+    
+    def reopen_if_rotated(self):
+        """Open the log file if needed, starting over when it was replaced or truncated"""
+        if self._fh is not None:
             try:
-                if self.log_file.exists():
-                    with open(self.log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        f.seek(self.last_position)
-                        new_lines = f.readlines()
-                        self.last_position = f.tell()
-                        
-                        if new_lines:
-                            for line in new_lines:
-                                line = line.strip()
-                                if line:
-                                    self.process_line(line)
-                            
-                            consecutive_errors = 0
-                        else:
-                            time.sleep(0.1)
-                else:
-                    time.sleep(1)
-                    consecutive_errors = 0
-                
-            except Exception as e:
-                consecutive_errors += 1
-                print(f"Error monitoring log file: {e}")
-                
-                if consecutive_errors >= max_errors:
-                    print(f"Too many consecutive errors, stopping monitoring")
-                    break
-                
-                sleep_time = min(1 * (2 ** consecutive_errors), 10)
-                time.sleep(sleep_time)
+                current = os.stat(self.log_file)
+            except FileNotFoundError:
+                return  # Keep the old handle until a new file appears
+            opened = os.fstat(self._fh.fileno())
+            if current.st_ino == opened.st_ino and current.st_size >= self.last_position:
+                return
+            self._fh.close()
+            self._fh = None
+            _logger.debug("Log file rotated or truncated, reading from start")
+        
+        if self.log_file.exists():
+            self._fh = open(self.log_file, 'rb', buffering=0)
+            self.last_position = 0
+            self.pending_bytes.clear()
+    
+    def read_new_lines(self, *args):
+        """Process every line appended since the last read"""
+        if not self.monitoring:
+            return
+        try:
+            self.reopen_if_rotated()
+            if self._fh is not None:
+                # The unbuffered handle stays where the last read ended: read the raw fd in large chunks
+                fd = self._fh.fileno()
+                while True:
+                    chunk = os.read(fd, 1 << 20)
+                    if not chunk:
+                        break
+                    self.last_position += len(chunk)
+                    self.pending_bytes += chunk
+                    
+                    # Only complete lines are handled; a partial last line waits for the rest
+                    line_end = self.pending_bytes.rfind(b'\n')
+                    if line_end < 0:
+                        continue
+                    complete = bytes(self.pending_bytes[:line_end])
+                    del self.pending_bytes[:line_end + 1]
+                    # Most reads carry no marker at all: two scans of the whole chunk skip splitting it
+                    if _SPELL_CAST_BYTES not in complete and _COMBAT_END_BYTES not in complete:
+                        continue
+                    for raw_line in complete.split(b'\n'):
+                        # Only the few lines carrying a marker are decoded; they are never empty,
+                        # and are left unstripped (the spell regex captures are stripped instead)
+                        if _SPELL_CAST_BYTES in raw_line or _COMBAT_END_BYTES in raw_line:
+                            self.process_line(raw_line.decode('utf-8', errors='ignore'))
+            
+            self.consecutive_errors = 0
+        
+        except Exception as e:
+            self.consecutive_errors += 1
+            _logger.warning("Error monitoring log file: %s", e)
+            
+            if self.consecutive_errors >= self.max_errors:
+                _logger.warning("Too many consecutive errors, stopping monitoring")
+                self.stop_monitoring()
+            elif self.retry_timer is not None:
+                # Retry after a short, doubling delay (capped at 10s); the jitter keeps
+                # several monitors from retrying in lockstep after a shared file-system hiccup
+                delay = min(10.0, 0.1 * (1 << self.consecutive_errors)) + random.random() * 0.1
+                self.retry_timer.start(int(delay * 1000))
     
     def process_line(self, line):
         """Process a log line for class detection"""
+        # Spell casts and the combat-end notice are the only lines that matter; everything else falls through
+        if "lance le sort" in line:
+            self.handle_spell_line(line)
+        elif line.rstrip().endswith(_COMBAT_END):  # The notice always closes the line (before a CR, if any)
+            self.handle_combat_end()
+    
+    def handle_spell_line(self, line):
+        """Start combat on a combat spell cast and detect the caster's class"""
+        combat_tag_pos = line.find(_COMBAT_TAG)
+        if combat_tag_pos < 0:
+            return
+        
         # Check for combat start
-        if "[Information (combat)]" in line and "lance le sort" in line:
-            if not self.in_combat:
-                self.in_combat = True
-                self.combat_started.emit()
-                print(f"DEBUG: Combat started")
-        
-        # Check for combat end
-        if "Combat terminé, cliquez ici pour rouvrir l'écran de fin de combat." in line:
-            if self.in_combat:
-                self.in_combat = False
-                self.combat_ended.emit()
-                print(f"DEBUG: Combat ended")
-                return
+        if not self.in_combat:
+            self.in_combat = True
+            self.combat_started.emit()
+            _logger.debug("Combat started")
         
-        # Only process combat lines for class detection
-        if "[Information (combat)]" not in line or "lance le sort" not in line:
+        # Only look for classes while some class is still unknown
+        if self.detected_classes.keys() >= _ALL_CLASSES:
             return
         
-        # Extract player and spell info
-        spell_match = re.search(r'\[Information \(combat\)\] ([^:]+)[:\s]+lance le sort ([^(]+)', line)
+        # Extract player and spell info, anchored at the combat tag
+        spell_match = _SPELL_CAST_RE.match(line, combat_tag_pos)
         if not spell_match:
             return
         
-        player_name = spell_match.group(1).strip()
         spell_name = spell_match.group(2).strip()
         
         # Detect class based on spells
         detected_class = self.detect_class(spell_name)
         if detected_class and detected_class not in self.detected_classes:
+            # One shared string for the stored name and the signal payload
+            player_name = sys.intern(spell_match.group(1).strip())
             self.detected_classes[detected_class] = player_name
-            print(f"DEBUG: {detected_class} detected: {player_name}")
+            _logger.debug("%s detected: %s", detected_class, player_name)
             self.class_detected.emit(detected_class, player_name)
     
+    def handle_combat_end(self):
+        """Leave combat on the combat-end notice"""
+        if self.in_combat:
+            self.in_combat = False
+            self.combat_ended.emit()
+            _logger.debug("Combat ended")
+    
     def detect_class(self, spell_name):
         """Detect class based on spell name"""
-        # Iop spells
-        iop_spells = [
-            "Épée céleste", "Fulgur", "Super Iop Punch", "Jugement", "Colère de Iop", 
-            "Ébranler", "Roknocerok", "Fendoir", "Ravage", "Jabs", "Rafale", 
-            "Torgnole", "Tannée", "Épée de Iop", "Bond", "Focus", "Éventrail", "Uppercut"
-        ]
-        
-        # Cra spells
-        cra_spells = [
-            "Flèche criblante", "Flèche fulminante", "Flèche d'immolation", 
-            "Flèche enflammée", "Flèche Ardente", "Flèche explosive", 
-            "Flèche cinglante", "Flèche perçante", "Flèche destructrice", 
-            "Flèche chercheuse", "Flèche de recul", "Flèche tempête", 
-            "Flèche harcelante", "Flèche statique", "Balise de destruction", 
-            "Balise d'alignement", "Balise de contact", "Tir précis", "Débalisage", "Eclaireur",
-            "Flèche lumineuse", "Pluie de flèches", "Roulade"
-        ]
-
-        # Ougi spells
-        ougi_spells = [
-            "Émeute", "Fléau", "Rupture", "Plombage", "Balafre", # Water spells
-            "Croc-en-jambe", "Bastonnade", "Molosse", "Hachure", "Saccade", # Earth spells
-            "Balayage", "Contusion", "Cador",  "Brise'Os", "Baroud", # Wind spells
-            "Chasseur", "Élan", "Canine", "Apaisement", "Poursuite", "Meute", # Neutral spells
-            "Proie", "Ougigarou", "Chienchien", "Poursuivant" # Innate spells
-        ]
-
-        if spell_name.lower() in (s.lower() for s in iop_spells):
-            return "Iop"
-        elif spell_name.lower() in (s.lower() for s in cra_spells):
-            return "Cra"
-        elif spell_name.lower() in (s.lower() for s in ougi_spells):
-            print(f"\nDEBUG: Ougi spell {spell_name} detected\n")
-            return "Ougi"
-
-        return None
+        detected_class = _SPELL_TO_CLASS.get(_spell_key(spell_name))
+        if detected_class == "Ougi":
+            _logger.debug("Ougi spell %s detected", spell_name)
+        return detected_class
     
     def stop_monitoring(self):
         """Stop monitoring"""
         self.monitoring = False
+        self.quit()
 
 class GradientBackgroundWidget(QWidget):
     """Custom widget with animated gradient background"""
@@ -2164,6 +2283,11 @@ def main():
     # Normal launcher mode
     app = QApplication(sys.argv)
     
+    # Log monitor tracing (--debug); silent otherwise
+    if "--debug" in sys.argv:
+        logging.basicConfig(format="DEBUG [%(asctime)s]: %(message)s", datefmt="%H:%M:%S")
+        _logger.setLevel(logging.DEBUG)
+    
     # Set application style
     app.setStyle('Fusion')
     